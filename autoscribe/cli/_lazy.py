@@ -0,0 +1,36 @@
+"""Lazy subcommand loading for the AutoScribe CLI."""
+
+import importlib
+
+import click
+from click import Context
+
+
+class LazyGroup(click.Group):
+    """A click group that imports subcommand modules only when invoked.
+
+    Subcommands are declared in ``lazy_subcommands`` as a mapping of
+    ``{name: ("module.path", "attribute")}`` and resolved on first use,
+    so ``--help`` and unrelated commands never import the other command
+    bodies (and whatever they pull in).
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, tuple[str, str]] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        self._cmd_cache: dict[str, click.Command] = {}
+
+    def list_commands(self, ctx: Context) -> list[str]:
+        commands = set(super().list_commands(ctx))
+        commands.update(self.lazy_subcommands)
+        return sorted(commands)
+
+    def get_command(self, ctx: Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self._cmd_cache:
+            return self._cmd_cache[cmd_name]
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr = self.lazy_subcommands[cmd_name]
+            command = getattr(importlib.import_module(module_name), attr)
+            self._cmd_cache[cmd_name] = command
+            return command
+        return super().get_command(ctx, cmd_name)
@@ -0,0 +1,109 @@
+"""The `generate` subcommand."""
+
+import functools
+import sys
+from typing import cast
+
+import click
+from click import Context
+
+from ...models.config import AutoScribeConfig
+from ...utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> bool:
+    """Load .env exactly once per process, and only for commands that read secrets."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return True
+
+
+@click.command()
+@click.option(
+    "-v",
+    "--version",
+    type=str,
+    help="Version number to generate",
+)
+@click.option(
+    "--ai/--no-ai",
+    default=None,
+    help="Enable/disable AI enhancement",
+)
+@click.option(
+    "--github-release/--no-github-release",
+    default=None,
+    help="Enable/disable GitHub release creation",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Bypass the on-disk cache of AI responses",
+)
+@click.pass_context
+def generate(
+    ctx: Context,
+    version: str | None = None,
+    ai: bool | None = None,
+    github_release: bool | None = None,
+    no_cache: bool = False,
+):
+    """Generate a new changelog version."""
+    from ..main import _ensure_logging, setup_services
+
+    _ensure_logging()
+    _load_env()
+    config = cast(AutoScribeConfig, ctx.obj["config"])
+
+    # Override config with CLI options
+    if ai is not None:
+        config.ai_enabled = ai
+    if github_release is not None:
+        config.github_release = github_release
+
+    try:
+        git_service, changelog_service, ai_service, github_service = setup_services(
+            config, use_ai_cache=not no_cache
+        )
+
+        # Generate version
+        if version is None:
+            logger.error("Version number is required")
+            sys.exit(1)
+
+        new_version = changelog_service.generate_version(version)
+        if not new_version:
+            logger.error("Failed to generate version")
+            sys.exit(1)
+
+        # Add version to changelog (add_version persists the file itself)
+        changelog_service.add_version(new_version)
+
+        # Create GitHub release if enabled
+        if github_service and github_service.is_available():
+            # Extract owner and repo from remote URL
+            owner, repo = git_service.extract_repo_info()
+            if not owner or not repo:
+                logger.error("Failed to extract repository information")
+                sys.exit(1)
+
+            success, url = github_service.create_release(
+                owner=owner,
+                repo=repo,
+                tag_name=f"v{new_version.number}",
+                name=f"Release {new_version.number}",
+                body=changelog_service.render_version(new_version),
+            )
+            if success:
+                logger.info(f"Created GitHub release: {url}")
+            else:
+                logger.error(f"Failed to create GitHub release: {url}")
+
+    except Exception as e:
+        logger.error(f"Generation failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,68 @@
+"""The `init` subcommand."""
+
+import sys
+from pathlib import Path
+
+import click
+from click import Context
+
+from ...utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Frozen at import so each init call writes the same shared object, as raw
+# bytes to skip the text-mode encoder.
+_DEFAULT_CONFIG_TOML = (
+    b"[tool.autoscribe]\n"
+    b'output = "CHANGELOG.md"\n'
+    b'version_file = "pyproject.toml"\n'
+    b"version_pattern = \"version = '{version}'\"\n"
+    b"github_release = true\n"
+    b"ai_enabled = true\n"
+    b'ai_model = "gpt-4"\n'
+)
+
+
+@click.command()
+@click.pass_context
+def init(ctx: Context):
+    """Initialize AutoScribe configuration."""
+    import toml
+
+    from ..main import _ensure_logging
+
+    _ensure_logging()
+    config = ctx.obj["config"]
+
+    try:
+        # Create changelog file if it doesn't exist
+        if not config.output.exists():
+            config.output.parent.mkdir(parents=True, exist_ok=True)
+            config.output.touch()
+            logger.info(f"Created changelog file at {config.output}")
+
+        # Create configuration file if it doesn't exist
+        config_file = Path("pyproject.toml")
+        if not config_file.exists():
+            # Single buffered write; avoids per-line syscalls on the template.
+            config_file.write_bytes(_DEFAULT_CONFIG_TOML)
+            logger.info("Initialized configuration in pyproject.toml")
+        else:
+            # Update existing configuration
+            config_data = toml.load(config_file)
+            config_data.setdefault("tool", {}).setdefault("autoscribe", {}).update(
+                {
+                    "output": str(config.output),
+                    "version_file": str(config.version_file),
+                    "version_pattern": config.version_pattern,
+                    "github_release": config.github_release,
+                    "ai_enabled": config.ai_enabled,
+                    "ai_model": config.ai_model,
+                }
+            )
+            config_file.write_text(toml.dumps(config_data), encoding="utf-8")
+            logger.info("Updated configuration in pyproject.toml")
+
+    except Exception as e:
+        logger.error(f"Initialization failed: {e}")
+        sys.exit(1)
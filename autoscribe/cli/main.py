@@ -1,30 +1,103 @@
 """Command-line interface for AutoScribe."""
 
+import functools
+import hashlib
+import json
 import os
-import sys
+import tempfile
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING
 
 import click
-import toml
 from click import Context
 
-from ..core.changelog import ChangelogService
-from ..core.git import GitService
+from .. import __version__
 from ..models.config import AutoScribeConfig
-from ..services.github import GitHubService
-from ..services.openai import AIService
 from ..utils.logging import get_logger
+from ._lazy import LazyGroup
+
+if TYPE_CHECKING:
+    from ..core.changelog import ChangelogService
+    from ..core.git import GitService
+    from ..services.github import GitHubService
+    from ..services.openai import AIService
 
 logger = get_logger(__name__)
 
+_logging_configured = False
+
+
+def _ensure_logging() -> None:
+    """Configure rich logging once, the first time a command actually runs.
+
+    `--help` and `--version` never log, so they skip handler setup entirely.
+    """
+    global _logging_configured
+    if not _logging_configured:
+        from ..utils.logging import setup_logger
+
+        setup_logger()
+        _logging_configured = True
+
+
+def _config_cache_file(abs_path: str, mtime_ns: int, size: int) -> Path:
+    """Return the cache file for a config path at a given mtime/size."""
+    key = hashlib.blake2b(
+        f"{abs_path}:{mtime_ns}:{size}:{__version__}".encode()
+    ).hexdigest()[:16]
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "autoscribe"
+    return cache_root / f"{key}.json"
+
+
+def _read_config_cache(cache_file: Path) -> dict | None:
+    """Load a cached config dict, or None if absent or unreadable."""
+    try:
+        with open(cache_file) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_config_cache(cache_file: Path, data: dict) -> None:
+    """Write a config dict to the cache atomically; failures are non-fatal."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(abs_path: str, mtime_ns: int, size: int) -> AutoScribeConfig:
+    """Load a config file, memoized per (path, mtime, size) within the process."""
+    cache_file = _config_cache_file(abs_path, mtime_ns, size)
+    config_data = _read_config_cache(cache_file)
+    if config_data is None:
+        import tomllib
+
+        with open(abs_path, "rb") as f:
+            config_data = tomllib.load(f).get("tool", {}).get("autoscribe", {})
+        _write_config_cache(cache_file, config_data)
+    return AutoScribeConfig(**config_data)
+
 
 def load_config(config_path: Path | None = None) -> AutoScribeConfig:
     """Load configuration from file or environment."""
-    if config_path and config_path.exists():
-        with open(config_path) as f:
-            config_data = toml.load(f)
-            return AutoScribeConfig(**config_data.get("tool", {}).get("autoscribe", {}))
+    if config_path:
+        # EAFP: the stat both guards existence and feeds the cache key, so
+        # there is no separate exists() syscall. Repeat invocations in the
+        # same process hit the in-memory cache; fresh processes hit the
+        # on-disk JSON cache.
+        try:
+            abs_path = config_path.resolve()
+            st = abs_path.stat()
+        except OSError:
+            pass
+        else:
+            return _load_config_cached(str(abs_path), st.st_mtime_ns, st.st_size)
 
     return AutoScribeConfig(
         github_token=os.getenv("GITHUB_TOKEN"),
@@ -34,15 +107,24 @@ def load_config(config_path: Path | None = None) -> AutoScribeConfig:
 
 def setup_services(
     config: AutoScribeConfig,
-) -> tuple[GitService, ChangelogService, AIService | None, GitHubService | None]:
+    use_ai_cache: bool = True,
+) -> "tuple[GitService, ChangelogService, AIService | None, GitHubService | None]":
     """Set up required services."""
+    # Imported lazily so that `--help` and `init` don't pay for the service
+    # modules on every invocation; the network libraries (openai, PyGithub)
+    # are only imported when their feature is actually enabled.
+    from ..core.changelog import ChangelogService
+    from ..core.git import GitService
+
     git_service = GitService()
     ai_service = None
     github_service = None
 
     if config.ai_enabled:
         try:
-            ai_service = AIService(config)
+            from ..services.openai import AIService
+
+            ai_service = AIService(config, use_cache=use_ai_cache)
             if not ai_service.is_available():
                 logger.warning("AI service is enabled but not available")
                 ai_service = None
@@ -52,6 +134,8 @@ def setup_services(
 
     if config.github_release:
         try:
+            from ..services.github import GitHubService
+
             github_service = GitHubService(config)
             if not github_service.is_available():
                 logger.warning("GitHub release is enabled but service not available")
@@ -64,7 +148,13 @@ def setup_services(
     return git_service, changelog_service, ai_service, github_service
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "generate": ("autoscribe.cli.commands.generate", "generate"),
+        "init": ("autoscribe.cli.commands.init", "init"),
+    },
+)
 @click.version_option(prog_name="autoscribe")
 @click.option(
     "-c",
@@ -79,127 +169,5 @@ def cli(ctx: Context, config: Path | None = None):
     ctx.obj["config"] = load_config(config)
 
 
-@cli.command()
-@click.option(
-    "-v",
-    "--version",
-    type=str,
-    help="Version number to generate",
-)
-@click.option(
-    "--ai/--no-ai",
-    default=None,
-    help="Enable/disable AI enhancement",
-)
-@click.option(
-    "--github-release/--no-github-release",
-    default=None,
-    help="Enable/disable GitHub release creation",
-)
-@click.pass_context
-def generate(
-    ctx: Context,
-    version: str | None = None,
-    ai: bool | None = None,
-    github_release: bool | None = None,
-):
-    """Generate a new changelog version."""
-    config = cast(AutoScribeConfig, ctx.obj["config"])
-
-    # Override config with CLI options
-    if ai is not None:
-        config.ai_enabled = ai
-    if github_release is not None:
-        config.github_release = github_release
-
-    try:
-        git_service, changelog_service, ai_service, github_service = setup_services(config)
-
-        # Generate version
-        if version is None:
-            logger.error("Version number is required")
-            sys.exit(1)
-
-        new_version = changelog_service.generate_version(version)
-        if not new_version:
-            logger.error("Failed to generate version")
-            sys.exit(1)
-
-        # Add version to changelog
-        changelog_service.add_version(new_version)
-        changelog_service._save_changelog()
-
-        # Create GitHub release if enabled
-        if github_service and github_service.is_available():
-            # Extract owner and repo from remote URL
-            owner, repo = git_service.extract_repo_info()
-            if not owner or not repo:
-                logger.error("Failed to extract repository information")
-                sys.exit(1)
-
-            success, url = github_service.create_release(
-                owner=owner,
-                repo=repo,
-                tag_name=f"v{new_version.number}",
-                name=f"Release {new_version.number}",
-                body=changelog_service.render_version(new_version),
-            )
-            if success:
-                logger.info(f"Created GitHub release: {url}")
-            else:
-                logger.error(f"Failed to create GitHub release: {url}")
-
-    except Exception as e:
-        logger.error(f"Generation failed: {e}")
-        sys.exit(1)
-
-
-@cli.command()
-@click.pass_context
-def init(ctx: Context):
-    """Initialize AutoScribe configuration."""
-    config = ctx.obj["config"]
-
-    try:
-        # Create changelog file if it doesn't exist
-        if not config.output.exists():
-            config.output.parent.mkdir(parents=True, exist_ok=True)
-            config.output.touch()
-            logger.info(f"Created changelog file at {config.output}")
-
-        # Create configuration file if it doesn't exist
-        config_file = Path("pyproject.toml")
-        if not config_file.exists():
-            config_file.write_text(
-                "[tool.autoscribe]\n"
-                'output = "CHANGELOG.md"\n'
-                'version_file = "pyproject.toml"\n'
-                'version_pattern = "version = \'{version}\'"\n'
-                "github_release = true\n"
-                "ai_enabled = true\n"
-                'ai_model = "gpt-4"\n'
-            )
-            logger.info("Initialized configuration in pyproject.toml")
-        else:
-            # Update existing configuration
-            config_data = toml.load(config_file)
-            config_data.setdefault("tool", {}).setdefault("autoscribe", {}).update(
-                {
-                    "output": str(config.output),
-                    "version_file": str(config.version_file),
-                    "version_pattern": config.version_pattern,
-                    "github_release": config.github_release,
-                    "ai_enabled": config.ai_enabled,
-                    "ai_model": config.ai_model,
-                }
-            )
-            config_file.write_text(toml.dumps(config_data))
-            logger.info("Updated configuration in pyproject.toml")
-
-    except Exception as e:
-        logger.error(f"Initialization failed: {e}")
-        sys.exit(1)
-
-
 if __name__ == "__main__":
     cli()
@@ -1,4 +1,9 @@
-from datetime import datetime
+import io
+import os
+import sys
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import date, datetime, time
 from pathlib import Path
 from typing import cast
 
@@ -7,6 +12,13 @@ from ..models.config import AutoScribeConfig, CategoryType
 from ..services.openai import AIService
 from .git import GitService
 
+CHANGELOG_HEADER = (
+    "# Changelog\n\n"
+    "All notable changes to this project will be documented in this file.\n\n"
+    "The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.1.0/),\n"
+    "and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).\n\n"
+)
+
 
 class ChangelogService:
     """Service for managing changelog generation and updates."""
@@ -41,6 +53,9 @@ class ChangelogService:
         "chore": "Changed",
         "revert": "Changed",
     }
+    # Interned keys and values let the categorization lookup use CPython's
+    # pointer-identity dict fast path when bucketing thousands of commits.
+    TYPE_TO_CATEGORY = {sys.intern(k): sys.intern(v) for k, v in TYPE_TO_CATEGORY.items()}
 
     def __init__(
         self,
@@ -52,6 +67,10 @@ class ChangelogService:
         self.config = config
         self.git_service = git_service
         self.ai_service = ai_service
+        # Category order and membership are fixed for the service lifetime,
+        # so compute them once instead of per _categorize_changes call.
+        self._category_order = tuple(config.categories)
+        self._allowed_categories = frozenset(self._category_order)
         self.changelog = self._load_or_create_changelog()
 
     def _load_or_create_changelog(self) -> Changelog:
@@ -64,21 +83,20 @@ class ChangelogService:
 
     def _categorize_changes(self, changes: list[Change]) -> dict[str, list[Change]]:
         """Categorize changes based on their type following Keep a Changelog."""
-        categories: dict[str, list[Change]] = {cat: [] for cat in self.config.categories}
+        buckets: dict[str, list[Change]] = defaultdict(list)
 
         for change in changes:
             if change.breaking:
                 # Breaking changes go into Changed category with a BREAKING CHANGE prefix
-                categories["Changed"].append(change)
-                continue
-
-            # Get category from type mapping, fallback to Changed if not found
-            category = self.TYPE_TO_CATEGORY.get(change.type, "Changed")
+                category = "Changed"
+            else:
+                # Get category from type mapping, fallback to Changed if not found
+                category = self.TYPE_TO_CATEGORY.get(change.type, "Changed")
             # Only add to category if it's configured
-            if category in categories:
-                categories[category].append(change)
+            if category in self._allowed_categories:
+                buckets[category].append(change)
 
-        return {k: v for k, v in categories.items() if v}
+        return {cat: buckets[cat] for cat in self._category_order if buckets[cat]}
 
     def generate_version(self, version_number: str) -> Version:
         """Generate a new version entry."""
@@ -86,55 +104,110 @@ class ChangelogService:
         last_tag = self.git_service.get_latest_tag()
         commits = self.git_service.get_commits_since_tag(last_tag)
 
-        # Create changes from commits
-        changes = [self.git_service.create_change_from_commit(commit) for commit in commits]
-
-        # Enhance changes with AI if available
-        if self.ai_service and self.ai_service.is_available():
-            changes = self.ai_service.enhance_changes(changes)
+        # Probe AI availability once; is_available() may hit the network.
+        # Bind a local so the None check narrows the type for the calls below.
+        ai = self.ai_service
+        if ai is not None and not ai.is_available():
+            ai = None
 
-        # Categorize changes
-        categorized_changes = self._categorize_changes(changes)
+        if ai is not None:
+            # AI enhancement needs the full list of changes up front.
+            changes = [self.git_service.create_change_from_commit(commit) for commit in commits]
+            changes = ai.enhance_changes(changes)
+            categorized_changes = self._categorize_changes(changes)
+            breaking_changes = any(change.breaking for change in changes)
+        else:
+            # Fast path: build and bucket changes in a single pass without
+            # materializing the intermediate list.
+            buckets: dict[str, list[Change]] = defaultdict(list)
+            breaking_changes = False
+            for commit in commits:
+                change = self.git_service.create_change_from_commit(commit)
+                breaking_changes = breaking_changes or change.breaking
+                if change.breaking:
+                    category = "Changed"
+                else:
+                    category = self.TYPE_TO_CATEGORY.get(change.type, "Changed")
+                if category in self._allowed_categories:
+                    buckets[category].append(change)
+            categorized_changes = {
+                cat: buckets[cat] for cat in self._category_order if buckets[cat]
+            }
 
         # Create version object
         version = Version(
             number=version_number,
-            date=datetime.now(),
+            # The renderer only prints the date part; midnight today keeps the
+            # field a datetime as the model declares.
+            date=datetime.combine(date.today(), time()),
             categories=[
                 Category(name=cast(CategoryType, name), changes=changes)
                 for name, changes in categorized_changes.items()
                 if name in self.config.categories  # Only include configured categories
             ],
-            breaking_changes=any(change.breaking for change in changes),
+            breaking_changes=breaking_changes,
             summary=None,  # Will be set by AI if available
             yanked=False,
             compare_url=None,  # Will be set by GitHub service if available
         )
 
         # Generate summary with AI if available
-        if self.ai_service and self.ai_service.is_available():
-            version = self.ai_service.generate_version_summary(version)
+        if ai is not None:
+            version = ai.generate_version_summary(version)
 
         return version
 
     def add_version(self, version: Version) -> None:
         """Add a new version to the changelog."""
         self.changelog.add_version(version)
-        self._save_changelog()
+        if not self._splice_version(version):
+            self._save_changelog()
+
+    def _splice_version(self, version: Version) -> bool:
+        """Insert one version block after the header of an existing changelog.
+
+        Avoids rewriting every past version on each release: only the new
+        block is rendered and the old tail is copied through unchanged.
+        Returns False when the file is missing or doesn't start with the
+        standard header, in which case the caller falls back to a full save.
+        """
+        output_path = Path(self.config.output)
+        try:
+            existing = output_path.read_bytes()
+        except OSError:
+            return False
+
+        header = CHANGELOG_HEADER.encode("utf-8")
+        if not existing.startswith(header):
+            return False
+
+        buf = io.StringIO()
+        self._render_version_into(version, buf.write)
+        buf.write("\n")
+
+        tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(buf.getvalue().encode("utf-8"))
+            f.write(existing[len(header):])
+        os.replace(tmp_path, output_path)
+        return True
 
     def _save_changelog(self) -> None:
         """Save the changelog to file in Keep a Changelog format."""
-        output = "# Changelog\n\n"
-        output += "All notable changes to this project will be documented in this file.\n\n"
-        output += "The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.1.0/),\n"
-        output += "and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).\n\n"
+        buf = io.StringIO()
+        write = buf.write
+        write(CHANGELOG_HEADER)
 
         for version in self.changelog.versions:
-            output += self.render_version(version)
-            output += "\n"
+            self._render_version_into(version, write)
+            write("\n")
 
-        with open(self.config.output, "w") as f:
-            f.write(output)
+        # Write atomically: a crash mid-write never leaves a truncated changelog.
+        output_path = Path(self.config.output)
+        tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+        tmp_path.write_text(buf.getvalue(), encoding="utf-8", newline="\n")
+        os.replace(tmp_path, output_path)
 
     def get_version(self, version_number: str) -> Version | None:
         """Get a specific version from the changelog."""
@@ -144,28 +217,40 @@ class ChangelogService:
         """Get the latest version from the changelog."""
         return self.changelog.get_latest_version()
 
-    def render_version(self, version: Version) -> str:
-        """Render a single version entry in Keep a Changelog format."""
-        output = f"## [{version.number}] - {version.date.strftime('%Y-%m-%d')}\n\n"
+    def _render_version_into(self, version: Version, write: Callable[[str], int]) -> None:
+        """Render a version entry through a write callable (e.g. ``buf.write``)."""
+        write(f"## [{version.number}] - {version.date.strftime('%Y-%m-%d')}\n\n")
 
         if version.summary:
-            output += f"{version.summary}\n\n"
+            write(f"{version.summary}\n\n")
 
         if version.breaking_changes:
-            output += "### ⚠️ BREAKING CHANGES\n\n"
+            write("### ⚠️ BREAKING CHANGES\n\n")
 
         for category in version.categories:
             if not category.changes:
                 continue
 
-            output += f"### {category.name}\n\n"
+            write(f"### {category.name}\n\n")
             for change in category.changes:
-                prefix = "BREAKING CHANGE: " if change.breaking else ""
-                scope = f"**{change.scope}**: " if change.scope else ""
-                output += f"- {prefix}{scope}{change.description}\n"
-            output += "\n"
+                # Emit pieces directly rather than building prefix/scope
+                # substrings and re-interpolating them per change.
+                write("- ")
+                if change.breaking:
+                    write("BREAKING CHANGE: ")
+                if change.scope:
+                    write("**")
+                    write(change.scope)
+                    write("**: ")
+                write(change.description)
+                write("\n")
+            write("\n")
 
-        return output
+    def render_version(self, version: Version) -> str:
+        """Render a single version entry in Keep a Changelog format."""
+        buf = io.StringIO()
+        self._render_version_into(version, buf.write)
+        return buf.getvalue()
 
     def get_unreleased_changes(self) -> Version | None:
         """Get the unreleased changes."""
@@ -3,11 +3,17 @@
 import os
 import re
 import subprocess
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import urlsplit
 
 from ..models.changelog import Change
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 class GitError(Exception):
@@ -25,7 +31,7 @@ class GitCommandError(GitError):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GitCommit:
     """Git commit information."""
 
@@ -38,7 +44,9 @@ class GitCommit:
 class GitService:
     """Service for interacting with Git repositories."""
 
-    CONVENTIONAL_TYPES = {
+    # Immutable view: shared class state nobody should mutate, and callers
+    # can use it directly without defensive copies.
+    CONVENTIONAL_TYPES = MappingProxyType({
         "feat": "Features",
         "fix": "Bug Fixes",
         "docs": "Documentation",
@@ -50,7 +58,17 @@ class GitService:
         "ci": "CI",
         "chore": "Chores",
         "revert": "Reverts",
-    }
+    })
+
+    # Compiled once at class-definition time; previously the pattern string
+    # was rebuilt and re-matched from scratch for every commit. Only the
+    # header line is matched — no DOTALL body capture, so huge commit bodies
+    # can't trigger pathological backtracking.
+    _CC_PATTERN = re.compile(
+        r"^(?P<type>"
+        + "|".join(CONVENTIONAL_TYPES)
+        + r")(?:\((?P<scope>[^)]+)\))?(?P<breaking>!)?: (?P<description>[^\n]+)"
+    )
 
     def __init__(self, repo_path: str | Path | None = None):
         """Initialize the git service.
@@ -63,18 +81,26 @@ class GitService:
         """
         self.repo_path = str(repo_path) if repo_path else os.getcwd()
         self.cwd = self.repo_path
+        # Read-only query results; these cannot change during a run unless
+        # this service itself mutates the repo (create_tag/push_tag). A key's
+        # presence marks "looked up", so None results are memoized too.
+        self._query_cache: dict = {}
 
-        # Validate git repository
+        # Validate the repository and collect repo facts in one spawn
+        # instead of issuing separate rev-parse calls later.
         try:
-            self._run_command("git rev-parse --git-dir")
+            output = self._run_command(["git", "rev-parse", "--git-dir", "--show-toplevel"])
         except GitCommandError as e:
             raise GitInitError(f"Not a git repository: {self.repo_path}") from e
+        git_dir, _, toplevel = output.partition("\n")
+        self._git_dir = git_dir
+        self._toplevel = toplevel or None
 
-    def _run_command(self, command: str) -> str:
+    def _run_command(self, argv: list[str]) -> str:
         """Run a git command and return its output.
 
         Args:
-            command: Git command to execute.
+            argv: Git command as an argv list (no shell involved).
 
         Returns:
             Command output as string.
@@ -84,48 +110,113 @@ class GitService:
         """
         try:
             result = subprocess.run(
-                command,
-                shell=True,
+                argv,
                 cwd=self.cwd,
                 capture_output=True,
                 text=True,
                 check=True,
             )
-            if result.stderr and not result.stdout:
-                raise subprocess.CalledProcessError(
-                    returncode=1,
-                    cmd=command,
-                    output=result.stdout,
-                    stderr=result.stderr
-                )
+            # Exit code is the only failure signal: many git commands
+            # (tag -a, push) write progress to stderr on success.
             return result.stdout.strip()
         except subprocess.CalledProcessError as e:
             raise GitCommandError(f"Git command failed: {e.stderr}") from e
         except Exception as e:
             raise GitCommandError(f"Error running git command: {str(e)}") from e
 
-    def get_commits_since_tag(self, tag: str | None = None) -> list[GitCommit]:
+    def _stream_command(self, argv: list[str]):
+        """Run a git command and yield its stdout line-by-line.
+
+        Unlike :meth:`_run_command`, stdout is never materialized as one
+        string, so large outputs (e.g. ``git log`` on a long history) are
+        processed with constant memory and the first line is available
+        before the command finishes.
+
+        Args:
+            argv: Git command as an argv list (no shell involved).
+
+        Yields:
+            Output lines with the trailing newline stripped.
+
+        Raises:
+            GitCommandError: If the command exits non-zero.
+        """
+        try:
+            proc = subprocess.Popen(
+                argv,
+                cwd=self.cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        except Exception as e:
+            raise GitCommandError(f"Error running git command: {str(e)}") from e
+        with proc:
+            assert proc.stdout is not None
+            for line in proc.stdout:
+                yield line.rstrip("\n")
+            stderr = proc.stderr.read() if proc.stderr else ""
+        if proc.wait() != 0:
+            raise GitCommandError(f"Git command failed: {stderr}")
+
+    # Cap applied when walking full history (no tag); changelog runs on
+    # huge repos shouldn't scan every commit ever made.
+    DEFAULT_MAX_COUNT = 5000
+
+    def get_commits_since_tag(
+        self,
+        tag: str | None = None,
+        max_count: int | None = None,
+        no_merges: bool = True,
+        first_parent: bool = False,
+    ) -> list[GitCommit]:
         """Get all commits since the specified tag.
 
         Args:
-            tag: Git tag to get commits since. If None, gets all commits.
+            tag: Git tag to get commits since. If None, gets all commits
+                up to ``DEFAULT_MAX_COUNT``.
+            max_count: Maximum number of commits to return. Defaults to
+                unbounded when a tag is given, ``DEFAULT_MAX_COUNT`` otherwise.
+            no_merges: Skip merge commits (they rarely carry changelog text).
+            first_parent: Follow only the first parent, for mainline-only
+                changelogs.
 
         Returns:
             List of commits.
         """
-        format_str = "%H|%s|%an|%aI"
+        if tag is None and max_count is None:
+            max_count = self.DEFAULT_MAX_COUNT
+            logger.warning(
+                "No tag given; limiting history walk to the %d most recent commits",
+                max_count,
+            )
+
+        # Unit/record separators can't appear in subjects or author names,
+        # unlike the previous '|' + newline framing.
+        format_str = "%H%x1f%s%x1f%an%x1f%aI%x1e"
+        argv = ["git", "log", f"--format={format_str}"]
         if tag:
-            command = f'git log {tag}..HEAD --format="{format_str}"'
-        else:
-            command = f'git log --format="{format_str}"'
+            argv.insert(2, f"{tag}..HEAD")
+        if max_count is not None:
+            argv.append(f"--max-count={max_count}")
+        if no_merges:
+            argv.append("--no-merges")
+        if first_parent:
+            argv.append("--first-parent")
+
+        cache_key = ("commits", tag, max_count, no_merges, first_parent)
+        if cache_key in self._query_cache:
+            return self._query_cache[cache_key]
 
         try:
-            output = self._run_command(command)
             commits = []
-            for line in output.split("\n"):
-                if not line:
+            # Each record is one line terminated by the \x1e separator;
+            # streaming avoids holding the whole log output in memory.
+            for line in self._stream_command(argv):
+                record = line.rstrip("\x1e")
+                if not record:
                     continue
-                hash_, message, author, date_str = line.split("|")
+                hash_, message, author, date_str = record.split("\x1f")
                 commits.append(
                     GitCommit(
                         hash=hash_,
@@ -134,6 +225,7 @@ class GitService:
                         date=datetime.fromisoformat(date_str),
                     )
                 )
+            self._query_cache[cache_key] = commits
             return commits
         except GitCommandError:
             return []
@@ -144,15 +236,30 @@ class GitService:
         Returns:
             Latest tag or None if no tags exist.
         """
+        if "latest_tag" in self._query_cache:
+            return self._query_cache["latest_tag"]
+
         try:
-            # Get all tags sorted by version number (v1.2.3 format)
-            tags = self._run_command("git tag -l 'v*'").split("\n")
-            if not tags or not tags[0]:
-                return None
-            # Sort tags by version components
-            return sorted(tags, key=lambda t: [int(n) for n in t[1:].split(".")], reverse=True)[0]
-        except (GitCommandError, ValueError):
+            # Let git sort the tags version-aware in C instead of
+            # materializing and sorting every tag string in Python.
+            output = self._run_command(["git", "tag", "-l", "v*", "--sort=-v:refname"])
+            latest = output.partition("\n")[0] or None
+        except GitCommandError:
             return None
+        self._query_cache["latest_tag"] = latest
+        return latest
+
+    @classmethod
+    def category_for(cls, type_: str) -> str:
+        """Map a conventional-commit type to its display category.
+
+        Args:
+            type_: Conventional commit type (e.g. "feat").
+
+        Returns:
+            Category name, or "Other" for unknown types.
+        """
+        return cls.CONVENTIONAL_TYPES.get(type_, "Other")
 
     def parse_conventional_commit(self, message: str) -> tuple[str, str | None, str, bool]:
         """Parse a conventional commit message.
@@ -163,14 +270,7 @@ class GitService:
         Returns:
             Tuple of (type, scope, description, breaking).
         """
-        # Regular expression for conventional commits
-        pattern = (
-            r"^(?P<type>" +
-            "|".join(self.CONVENTIONAL_TYPES.keys()) +
-            r")(?:\((?P<scope>[^)]+)\))?(?P<breaking>!)?: (?P<description>[^\n]+)"
-            r"(?:\n\n(?P<body>.+))?$"
-        )
-        match = re.match(pattern, message, re.DOTALL)
+        match = self._CC_PATTERN.match(message)
 
         if not match:
             return "other", None, message, False
@@ -180,10 +280,11 @@ class GitService:
         description = match.group("description")
         breaking = bool(match.group("breaking"))
 
-        # Check for breaking changes in body
-        body = match.group("body")
-        if body and "BREAKING CHANGE:" in body:
-            breaking = True
+        # Check for breaking changes in body (everything after the first
+        # blank line); a C-level find beats regex-capturing the whole body.
+        if not breaking:
+            body = message.partition("\n\n")[2]
+            breaking = "BREAKING CHANGE:" in body
 
         return type_, scope, description, breaking
 
@@ -197,13 +298,17 @@ class GitService:
             Change object.
         """
         type_, scope, description, breaking = self.parse_conventional_commit(commit.message)
-        return Change(
+        # Every field is supplied and already well-typed, so skip pydantic
+        # validation — it runs once per commit on large histories.
+        return Change.model_construct(
             description=description,
             commit_hash=commit.hash,
             commit_message=commit.message,
             author=commit.author,
-            type=type_,
-            scope=scope,
+            # Interned so category lookups compare by pointer identity; most
+            # repos reuse a small fixed set of types and scopes.
+            type=sys.intern(type_),
+            scope=sys.intern(scope) if scope else scope,
             breaking=breaking,
             ai_enhanced=False,
             references=[],  # Extract references from commit message if needed
@@ -221,7 +326,9 @@ class GitService:
         """
         if not tag or not message:
             raise GitCommandError("Tag name and message are required")
-        self._run_command(f'git tag -a {tag} -m "{message}"')
+        self._run_command(["git", "tag", "-a", tag, "-m", message])
+        # Tag state changed; cached tag/commit queries are now stale.
+        self._query_cache.clear()
 
     def push_tag(self, tag: str) -> None:
         """Push a tag to the remote repository.
@@ -234,7 +341,7 @@ class GitService:
         """
         if not tag:
             raise GitCommandError("Tag name is required")
-        self._run_command(f"git push origin {tag}")
+        self._run_command(["git", "push", "origin", tag])
 
     def get_remote_url(self) -> str | None:
         """Get the remote repository URL.
@@ -242,10 +349,15 @@ class GitService:
         Returns:
             Remote URL or None if no remote exists.
         """
+        if "remote_url" in self._query_cache:
+            return self._query_cache["remote_url"]
+        url: str | None
         try:
-            return self._run_command("git remote get-url origin")
+            url = self._run_command(["git", "config", "--get", "remote.origin.url"])
         except GitCommandError:
-            return None
+            url = None
+        self._query_cache["remote_url"] = url
+        return url
 
     def extract_repo_info(self) -> tuple[str | None, str | None]:
         """Extract owner and repository name from remote URL.
@@ -253,17 +365,29 @@ class GitService:
         Returns:
             Tuple of (owner, repo) or (None, None) if not found.
         """
+        if "repo_info" in self._query_cache:
+            return self._query_cache["repo_info"]
+
         url = self.get_remote_url()
         if not url:
             return None, None
 
-        # Match GitHub HTTPS or SSH URL patterns
-        https_pattern = r"https://github\.com/([^/]+)/([^/.]+)(?:\.git)?"
-        ssh_pattern = r"git@github\.com:([^/]+)/([^/.]+)(?:\.git)?"
-
-        for pattern in [https_pattern, ssh_pattern]:
-            match = re.match(pattern, url)
-            if match:
-                return match.group(1), match.group(2)
+        # Known GitHub URL shapes; plain prefix checks and splits beat
+        # running the regex engine over the URL.
+        if url.endswith(".git"):
+            url = url[:-4]
+
+        path = None
+        if url.startswith("git@github.com:"):
+            path = url[len("git@github.com:"):]
+        elif url.startswith(("https://github.com/", "http://github.com/")):
+            path = urlsplit(url).path.lstrip("/")
+
+        if path:
+            owner, sep, repo = path.partition("/")
+            if sep and owner and repo and "/" not in repo:
+                info = (owner, repo)
+                self._query_cache["repo_info"] = info
+                return info
 
         return None, None
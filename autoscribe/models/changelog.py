@@ -1,7 +1,18 @@
+from collections import deque
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+# Shared default for Changelog.description; a single module-level constant
+# rather than a per-class-body literal so bulk loaders can reuse it directly.
+KEEP_A_CHANGELOG_DESCRIPTION = (
+    "All notable changes to this project will be documented in this file.\n\n"
+    "The format is based on [Keep a Changelog]"
+    "(https://keepachangelog.com/en/1.1.0/),\n"
+    "and this project adheres to [Semantic Versioning]"
+    "(https://semver.org/spec/v2.0.0.html)."
+)
 
 
 class Change(BaseModel):
@@ -61,22 +72,16 @@ class Version(BaseModel):
 class Changelog(BaseModel):
     """Represents the complete changelog following Keep a Changelog format."""
 
-    versions: list[Version] = Field(
-        default_factory=list,
-        description="List of versions"
+    versions: deque[Version] = Field(
+        default_factory=deque,
+        description="Versions, latest first (deque for O(1) prepend)"
     )
     title: str = Field(
         default="Changelog",
         description="Changelog title"
     )
     description: str = Field(
-        default=(
-            "All notable changes to this project will be documented in this file.\n\n"
-            "The format is based on [Keep a Changelog]"
-            "(https://keepachangelog.com/en/1.1.0/),\n"
-            "and this project adheres to [Semantic Versioning]"
-            "(https://semver.org/spec/v2.0.0.html)."
-        ),
+        default=KEEP_A_CHANGELOG_DESCRIPTION,
         description="Keep a Changelog standard description"
     )
     last_updated: datetime = Field(
@@ -84,24 +89,32 @@ class Changelog(BaseModel):
         description="Last update timestamp"
     )
 
+    # O(1) lookup structures maintained alongside `versions`.
+    _index: dict[str, Version] = PrivateAttr(default_factory=dict)
+    _latest_released: Version | None = PrivateAttr(default=None)
+
+    def model_post_init(self, __context) -> None:
+        """Index versions supplied at construction time."""
+        for version in self.versions:
+            self._index[version.number] = version
+            if self._latest_released is None and version.number != "Unreleased":
+                self._latest_released = version
+
     def add_version(self, version: Version) -> None:
         """Add a new version to the changelog, maintaining reverse chronological order."""
-        self.versions.insert(0, version)  # Always insert at the beginning for latest first
+        self.versions.appendleft(version)  # Always insert at the beginning for latest first
+        self._index[version.number] = version
+        if version.number != "Unreleased":
+            self._latest_released = version
         self.last_updated = datetime.now()
 
     def get_version(self, version_number: str) -> Version | None:
         """Get a specific version by number."""
-        for version in self.versions:
-            if version.number == version_number:
-                return version
-        return None
+        return self._index.get(version_number)
 
     def get_latest_version(self) -> Version | None:
         """Get the latest version (excluding unreleased)."""
-        for version in self.versions:
-            if version.number != "Unreleased":
-                return version
-        return None
+        return self._latest_released
 
     def get_unreleased_changes(self) -> Version | None:
         """Get unreleased changes if they exist."""
@@ -91,6 +91,15 @@ class AutoScribeConfig(BaseModel):
         default=None,
         description="OpenAI API key",
     )
+    max_concurrent_requests: int = Field(
+        default=10,
+        gt=0,
+        description="Maximum concurrent OpenAI requests",
+    )
+    batch_mode: bool = Field(
+        default=False,
+        description="Use the OpenAI Batch API for change enhancement",
+    )
 
     @model_validator(mode="after")
     def resolve_env_vars(self) -> "AutoScribeConfig":
@@ -106,21 +115,24 @@ class AutoScribeConfig(BaseModel):
         return self
 
     @field_validator("output", "version_file", mode="before")
-    def resolve_paths(self, v: str | Path) -> Path:
+    @classmethod
+    def resolve_paths(cls, v: str | Path) -> Path:
         """Resolve paths to absolute paths."""
         if isinstance(v, str):
             v = Path(v)
         return v.resolve()
 
     @field_validator("ai_model")
-    def validate_ai_model(self, v: str) -> str:
+    @classmethod
+    def validate_ai_model(cls, v: str) -> str:
         """Validate AI model."""
         if v not in VALID_AI_MODELS:
             raise ValueError(f"Invalid AI model: {v}")
         return v
 
     @field_validator("categories")
-    def validate_categories(self, v: list[str]) -> list[str]:
+    @classmethod
+    def validate_categories(cls, v: list[str]) -> list[str]:
         """Validate categories."""
         for category in v:
             if category not in VALID_CATEGORIES:
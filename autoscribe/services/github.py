@@ -1,7 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, cast
 
 from github import BadCredentialsException, Github, GithubException
 from github.Repository import Repository
+from urllib3.util.retry import Retry
 
 from ..models.config import AutoScribeConfig
 from ..utils.logging import get_logger
@@ -16,20 +18,53 @@ class GitHubService:
         """Initialize the GitHub service."""
         self.config = config
         self._github: Github | None = None
+        self._client_token: str | None = None
+        self._repo_cache: dict[str, Repository] = {}
+        self._release_cache: dict[tuple[str, str, str], dict[str, Any]] = {}
+        self._available: bool | None = None
         if config.github_token:
-            try:
-                self._github = Github(config.github_token)
-                # Test connection
-                if self._github is not None:
-                    # Store login to verify credentials
-                    login = self._github.get_user().login
-                    logger.info(f"Successfully initialized GitHub client for user {login}")
-            except GithubException as e:
-                logger.error(f"Failed to initialize GitHub client: {e}")
-                self._github = None
-            except Exception as e:
-                logger.error(f"Unexpected error initializing GitHub client: {e}")
-                self._github = None
+            self._github = self._build_client(config.github_token)
+            self._client_token = config.github_token
+
+    @staticmethod
+    def _build_client(token: str) -> Github | None:
+        """Build a client with pooled connections and bounded retries.
+
+        Pooled connections: every release-flow call hits api.github.com,
+        so reusing sockets across requests skips the TLS handshake on all
+        but the first. Bounded retries handle transient 5xx/429 responses.
+        Token validation is deferred to is_available() so construction
+        makes no network round-trip.
+        """
+        try:
+            return Github(
+                token,
+                pool_size=4,
+                retry=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                ),
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error initializing GitHub client: {e}")
+            return None
+
+    def _refresh_client(self) -> None:
+        """Rebuild the client when the configured token has changed.
+
+        The client and the memoized availability/repo/release caches are
+        all tied to the token they were created with; a config edit at
+        runtime must not keep serving results for the old credentials.
+        """
+        token = self.config.github_token
+        if token == self._client_token:
+            return
+        self._github = self._build_client(token) if token else None
+        self._client_token = token
+        self._available = None
+        self._repo_cache.clear()
+        self._release_cache.clear()
 
     def create_release(
         self,
@@ -48,7 +83,7 @@ class GitHubService:
         try:
             if self._github is None:
                 return False, "GitHub client is not initialized"
-            repository = cast(Repository, self._github.get_repo(f"{owner}/{repo}"))
+            repository = self._get_repo(owner, repo)
             release = repository.create_git_release(
                 tag=tag_name,
                 name=name,
@@ -62,6 +97,39 @@ class GitHubService:
         except Exception as e:
             return False, f"Unexpected error: {str(e)}"
 
+    def _get_repo(self, owner: str, repo: str) -> Repository:
+        """Get a repository handle, cached per owner/repo to save a round-trip."""
+        # Callers check the client before getting here; the assert narrows
+        # the Optional for the call below.
+        assert self._github is not None
+        full_name = f"{owner}/{repo}"
+        repository = self._repo_cache.get(full_name)
+        if repository is None:
+            repository = cast(Repository, self._github.get_repo(full_name))
+            self._repo_cache[full_name] = repository
+        return repository
+
+    def _evict_release(self, release_id: int) -> None:
+        """Drop cached lookups for a release that was just mutated."""
+        self._release_cache = {
+            key: data for key, data in self._release_cache.items()
+            if data["id"] != release_id
+        }
+
+    def create_releases_bulk(self, specs: list[dict[str, Any]]) -> list[tuple[bool, str]]:
+        """Create several releases concurrently.
+
+        Each spec is a keyword-argument dict for :meth:`create_release`.
+        The calls are latency-bound network round-trips, so running them on
+        a small thread pool completes N releases in roughly the time of the
+        slowest one. Results come back in the same order as ``specs``.
+        """
+        if not specs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(8, len(specs))) as executor:
+            return list(executor.map(lambda spec: self.create_release(**spec), specs))
+
     def update_release(
         self,
         owner: str,
@@ -80,7 +148,7 @@ class GitHubService:
         try:
             if self._github is None:
                 return False, "GitHub client is not initialized"
-            repository = cast(Repository, self._github.get_repo(f"{owner}/{repo}"))
+            repository = self._get_repo(owner, repo)
             release = repository.get_release(release_id)
             release.update_release(
                 tag_name=tag_name,
@@ -89,6 +157,7 @@ class GitHubService:
                 draft=draft,
                 prerelease=prerelease,
             )
+            self._evict_release(release_id)
             return True, release.html_url
         except GithubException as e:
             return False, str(e)
@@ -98,14 +167,23 @@ class GitHubService:
     def get_release_by_tag(
         self, owner: str, repo: str, tag: str
     ) -> tuple[bool, dict[str, Any] | None]:
-        """Get a release by its tag name."""
+        """Get a release by its tag name.
+
+        Successful lookups are cached per (owner, repo, tag) for the life
+        of the service, so get-then-update flows fetch each release once.
+        """
         if not self.is_available():
             return False, None
 
+        cache_key = (owner, repo, tag)
+        cached = self._release_cache.get(cache_key)
+        if cached is not None:
+            return True, cached
+
         try:
             if self._github is None:
                 return False, None
-            repository = cast(Repository, self._github.get_repo(f"{owner}/{repo}"))
+            repository = self._get_repo(owner, repo)
             # First try to get the release directly
             try:
                 release = repository.get_release(tag)
@@ -117,7 +195,7 @@ class GitHubService:
                 except StopIteration:
                     return False, None
 
-            return True, {
+            data = {
                 "id": release.id,
                 "html_url": release.html_url,
                 "tag_name": release.tag_name,
@@ -128,6 +206,8 @@ class GitHubService:
                 "created_at": release.created_at,
                 "published_at": release.published_at,
             }
+            self._release_cache[cache_key] = data
+            return True, data
         except GithubException:
             return False, None
         except Exception:
@@ -143,9 +223,10 @@ class GitHubService:
         try:
             if self._github is None:
                 return False, "GitHub client is not initialized"
-            repository = cast(Repository, self._github.get_repo(f"{owner}/{repo}"))
+            repository = self._get_repo(owner, repo)
             release = repository.get_release(release_id)
             release.delete_release()
+            self._evict_release(release_id)
             return True, None
         except GithubException as e:
             return False, str(e)
@@ -156,11 +237,14 @@ class GitHubService:
         """Check if the GitHub service is available."""
         if not self.config.github_release or not self.config.github_token:
             return False
+        self._refresh_client()
         if not self._github:
             return False
-        try:
-            # Verify credentials by getting the authenticated user
-            user = self._github.get_user()
-            return bool(user.login)
-        except (GithubException, BadCredentialsException):
-            return False
+        if self._available is None:
+            try:
+                # Verify credentials by getting the authenticated user
+                user = self._github.get_user()
+                self._available = bool(user.login)
+            except (GithubException, BadCredentialsException):
+                self._available = False
+        return self._available
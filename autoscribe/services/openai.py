@@ -1,6 +1,17 @@
 """Service for interacting with OpenAI API."""
 
-from openai import APIError, AuthenticationError, OpenAI, OpenAIError
+import asyncio
+import hashlib
+import io
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import cast
+
+from openai import APIError, AsyncOpenAI, AuthenticationError, OpenAI, OpenAIError
 
 from ..models.changelog import Change, Version
 from ..models.config import AutoScribeConfig
@@ -8,38 +19,289 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Bump when the prompts change so stale cached responses are not reused.
+_PROMPT_VERSION = "v1"
+
+# Retry attempts for transient failures (429/5xx/timeouts). The SDK
+# retries these itself with exponential backoff and jitter; the default
+# of 2 gives up too early under rate pressure.
+_MAX_RETRIES = 5
+
+# Changes packed into one batched completion request; bounds prompt size
+# so large releases don't overflow the model context window.
+_BATCH_SIZE = 50
+
+# At most this many changes per category are listed in the version-summary
+# prompt; beyond that the tail is collapsed into a count.
+_SUMMARY_CHANGES_PER_CATEGORY = 20
+
+# System prompts are constant; build them once instead of per call.
+_SYS_MSG_CHANGE = "You are a helpful assistant that explains code changes."
+_SYS_MSG_SUMMARY = "You are a helpful assistant that summarizes software releases."
+
+
+def _cache_file() -> Path:
+    """Return the on-disk cache file for AI responses."""
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "autoscribe"
+    return cache_root / "ai-cache.json"
+
+
+# One client per API key for the whole process: each OpenAI client owns
+# an httpx connection pool, so constructing AIService repeatedly (tests,
+# multi-repo runs) would otherwise re-handshake and leak descriptors.
+_CLIENT_CACHE: dict[str, OpenAI] = {}
+_ACLIENT_CACHE: dict[str, AsyncOpenAI] = {}
+
+
+def _client_key(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def _shared_client(api_key: str) -> OpenAI:
+    """Return the process-wide sync client for an API key."""
+    key = _client_key(api_key)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = OpenAI(api_key=api_key, max_retries=_MAX_RETRIES)
+        _CLIENT_CACHE[key] = client
+    return client
+
+
+def _shared_aclient(api_key: str) -> AsyncOpenAI:
+    """Return the process-wide async client for an API key."""
+    key = _client_key(api_key)
+    client = _ACLIENT_CACHE.get(key)
+    if client is None:
+        client = AsyncOpenAI(api_key=api_key, max_retries=_MAX_RETRIES)
+        _ACLIENT_CACHE[key] = client
+    return client
+
 
 class AIService:
     """Service for interacting with OpenAI API."""
 
-    def __init__(self, config: AutoScribeConfig):
-        """Initialize the AI service."""
+    def __init__(self, config: AutoScribeConfig, use_cache: bool = True):
+        """Initialize the AI service.
+
+        Args:
+            config: AutoScribe configuration.
+            use_cache: Reuse previously generated descriptions and summaries
+                from the on-disk cache. Re-running on the same repo (CI,
+                release drafting) then skips every repeat API call.
+        """
         self.config = config
+        # Client construction and the availability probe are deferred to
+        # first use: a service that is built but never asked to enhance
+        # anything costs zero network I/O.
         self._client: OpenAI | None = None
-        if config.ai_enabled and config.openai_api_key:
+        self._aclient: AsyncOpenAI | None = None
+        self._use_cache = use_cache
+        self._cache: dict[str, str] | None = None
+        self._available: bool | None = None
+
+    def _get_client(self) -> OpenAI | None:
+        """Create the sync client on first use."""
+        if self._client is None and self.config.ai_enabled and self.config.openai_api_key:
             try:
-                self._client = OpenAI(api_key=config.openai_api_key)
-                # Test connection
-                if self._client is not None:
-                    self._client.models.list()
-                    logger.info("Successfully initialized OpenAI client")
-            except OpenAIError as e:
-                logger.error(f"Failed to initialize OpenAI client: {e}")
-                self._client = None
+                self._client = _shared_client(self.config.openai_api_key)
             except Exception as e:
-                logger.error(f"Unexpected error initializing OpenAI client: {e}")
-                self._client = None
+                logger.error("Unexpected error initializing OpenAI client: %s", e)
+        return self._client
+
+    def _load_cache(self) -> dict[str, str]:
+        """Load the response cache from disk on first use."""
+        if self._cache is None:
+            try:
+                with open(_cache_file()) as f:
+                    self._cache = json.load(f)
+            except (OSError, ValueError):
+                self._cache = {}
+        return self._cache
+
+    def _save_cache(self) -> None:
+        """Write the response cache atomically; failures are non-fatal."""
+        if not self._use_cache or self._cache is None:
+            return
+        cache_file = _cache_file()
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._cache, f)
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass
+
+    def _cache_key(self, payload: str) -> str:
+        """Build a cache key covering the model, payload and prompt version."""
+        return hashlib.blake2b(
+            f"{self.config.ai_model}|{payload}|{_PROMPT_VERSION}".encode(),
+            digest_size=16,
+        ).hexdigest()
 
     def enhance_changes(self, changes: list[Change]) -> list[Change]:
-        """Enhance change descriptions with AI."""
-        if not self.is_available():
+        """Enhance change descriptions with AI.
+
+        All changes are sent in a single chat-completion request; one
+        round-trip costs the same latency as one change, so batching turns
+        N network waits into one. Falls back to per-change requests if the
+        batched response can't be parsed. Descriptions are cached on disk
+        by commit hash, so only commits not seen before hit the API.
+        """
+        if not changes or not self.is_available():
             return changes
 
+        if self.config.batch_mode:
+            return self.enhance_changes_batch(changes)
+
         try:
             if self._client is None:
                 return changes
 
-            enhanced_changes = []
+            cache = self._load_cache() if self._use_cache else None
+            results: list[Change | None] = [None] * len(changes)
+            pending: list[int] = []
+            for i, change in enumerate(changes):
+                cached = (
+                    cache.get(self._cache_key(change.commit_hash)) if cache is not None else None
+                )
+                if cached is not None:
+                    results[i] = self._with_description(change, cached)
+                else:
+                    pending.append(i)
+
+            if pending:
+                # Repos repeat near-identical messages ("chore: bump deps",
+                # "fix typo", ...); enhance one representative per unique
+                # prompt input and broadcast its description to the group.
+                groups: dict[tuple, list[int]] = {}
+                for i in pending:
+                    change = changes[i]
+                    key = (change.type, change.scope, change.commit_message, change.breaking)
+                    groups.setdefault(key, []).append(i)
+
+                representatives = [changes[indices[0]] for indices in groups.values()]
+                # Pack at most _BATCH_SIZE changes per request so huge
+                # releases stay inside the model's context window while
+                # still sending far fewer requests than one-per-change.
+                descriptions: list[str | None] = []
+                for start in range(0, len(representatives), _BATCH_SIZE):
+                    batch = representatives[start:start + _BATCH_SIZE]
+                    batch_descriptions = self._enhance_batch(batch)
+                    if batch_descriptions is not None:
+                        descriptions.extend(batch_descriptions)
+                    else:
+                        # Batch response was unusable; pay the per-change
+                        # cost, but run the independent requests concurrently
+                        # so wall time is bounded by the slowest call.
+                        enhanced = self._enhance_concurrently(batch)
+                        descriptions.extend(
+                            change.description if change.ai_enhanced else None
+                            for change in enhanced
+                        )
+
+                for indices, description in zip(groups.values(), descriptions, strict=True):
+                    for i in indices:
+                        if description is None:
+                            results[i] = changes[i]
+                        else:
+                            results[i] = self._with_description(changes[i], description)
+                            if cache is not None:
+                                cache[self._cache_key(changes[i].commit_hash)] = description
+                self._save_cache()
+
+            # Every slot is filled by now: cached indices up front, pending
+            # indices in the loop above.
+            return cast(list[Change], results)
+        except OpenAIError as e:
+            logger.error("Failed to enhance changes: %s", e)
+            return changes
+        except Exception as e:
+            logger.error("Unexpected error enhancing changes: %s", e)
+            return changes
+
+    def _enhance_batch(self, changes: list[Change]) -> list[str] | None:
+        """Rewrite all change descriptions in one completion call.
+
+        Returns:
+            Descriptions in input order, or None if the response can't be
+            mapped back onto the input.
+        """
+        # Only dispatched from enhance_changes after its client check.
+        assert self._client is not None
+        numbered = "\n".join(
+            f"{i}. {change.commit_message}" for i, change in enumerate(changes, 1)
+        )
+        prompt = (
+            "Rewrite each commit message below as a concise, user-friendly "
+            "changelog entry that explains the purpose and impact of the "
+            "change. Respond with a JSON object of the form "
+            '{"descriptions": ["...", ...]} containing exactly one entry '
+            "per commit, in the same order.\n\n"
+            f"{numbered}"
+        )
+
+        response = self._client.chat.completions.create(
+            model=self.config.ai_model,
+            messages=[
+                {"role": "system", "content": _SYS_MSG_CHANGE},
+                {"role": "user", "content": prompt},
+            ],
+            response_format={"type": "json_object"},
+        )
+
+        content = response.choices[0].message.content
+        if content is None:
+            logger.warning("Received empty response from OpenAI")
+            return None
+
+        try:
+            data = json.loads(content)
+        except ValueError:
+            logger.warning("Could not parse batched OpenAI response as JSON")
+            return None
+
+        descriptions = data.get("descriptions") if isinstance(data, dict) else data
+        if (
+            not isinstance(descriptions, list)
+            or len(descriptions) != len(changes)
+            or not all(isinstance(d, str) for d in descriptions)
+        ):
+            logger.warning("Batched OpenAI response did not match the input changes")
+            return None
+
+        return [description.strip() for description in descriptions]
+
+    def enhance_changes_batch(
+        self,
+        changes: list[Change],
+        poll_interval: float = 30.0,
+        timeout: float = 24 * 3600,
+    ) -> list[Change]:
+        """Enhance changes through the OpenAI Batch API.
+
+        Batch jobs cost half the synchronous price and draw from a
+        separate, much larger rate-limit pool, at the cost of completing
+        asynchronously (up to 24h). Suited to non-interactive full-history
+        regeneration; interactive runs should use :meth:`enhance_changes`.
+
+        Args:
+            changes: Changes to enhance.
+            poll_interval: Seconds between batch status polls.
+            timeout: Give up and return the original changes after this long.
+
+        Returns:
+            Enhanced changes in input order; changes whose request failed
+            come back unmodified.
+        """
+        if not changes or not self.is_available():
+            return changes
+        client = self._get_client()
+        if client is None:
+            return changes
+
+        try:
+            lines = []
             for change in changes:
                 prompt = (
                     "Given the following commit message, please provide a more descriptive "
@@ -49,46 +311,220 @@ class AIService:
                     "Please provide a concise, clear description that explains the "
                     "purpose and impact of this change."
                 )
+                lines.append(json.dumps({
+                    "custom_id": change.commit_hash,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.config.ai_model,
+                        "messages": [
+                            {"role": "system", "content": _SYS_MSG_CHANGE},
+                            {"role": "user", "content": prompt},
+                        ],
+                    },
+                }))
 
-                response = self._client.chat.completions.create(
-                    model=self.config.ai_model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a helpful assistant that explains code changes."
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                )
+            batch_file = client.files.create(
+                file=io.BytesIO("\n".join(lines).encode()),
+                purpose="batch",
+            )
+            batch = client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
 
-                content = response.choices[0].message.content
-                if content is None:
-                    logger.warning("Received empty response from OpenAI")
-                    continue
+            deadline = time.monotonic() + timeout
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if time.monotonic() > deadline:
+                    logger.error("Batch %s timed out after %.0fs", batch.id, timeout)
+                    return changes
+                time.sleep(poll_interval)
+                batch = client.batches.retrieve(batch.id)
 
-                enhanced_description = content.strip()
-                enhanced_changes.append(
-                    Change(
-                        description=enhanced_description,
-                        commit_hash=change.commit_hash,
-                        commit_message=change.commit_message,
-                        author=change.author,
-                        type=change.type,
-                        scope=change.scope,
-                        breaking=change.breaking,
-                        ai_enhanced=True,
-                        references=change.references,
-                    )
-                )
+            if batch.status != "completed" or not batch.output_file_id:
+                logger.error("Batch %s finished with status %s", batch.id, batch.status)
+                return changes
+
+            descriptions: dict[str, str] = {}
+            output = client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                if not line:
+                    continue
+                record = json.loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                content = response["body"]["choices"][0]["message"]["content"]
+                if content:
+                    descriptions[record["custom_id"]] = content.strip()
 
-            return enhanced_changes
+            return [
+                self._with_description(change, descriptions[change.commit_hash])
+                if change.commit_hash in descriptions
+                else change
+                for change in changes
+            ]
         except OpenAIError as e:
-            logger.error(f"Failed to enhance changes: {e}")
+            logger.error("Failed to enhance changes via batch: %s", e)
             return changes
         except Exception as e:
-            logger.error(f"Unexpected error enhancing changes: {e}")
+            logger.error("Unexpected error in batch enhancement: %s", e)
+            return changes
+
+    def _enhance_concurrently(self, changes: list[Change]) -> list[Change]:
+        """Fan per-change requests out concurrently from sync code.
+
+        Prefers the async client (one event loop, no thread stack per
+        request); falls back to a thread pool if an event loop is already
+        running in this thread.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aenhance_changes(changes))
+        with ThreadPoolExecutor(
+            max_workers=min(self.config.max_concurrent_requests, len(changes))
+        ) as executor:
+            return list(executor.map(self._enhance_one, changes))
+
+    def _get_aclient(self) -> AsyncOpenAI:
+        """Create the async client on first use.
+
+        Only reached after is_available(), so a missing key signals a
+        config edit mid-run and is surfaced as an OpenAIError.
+        """
+        if self._aclient is None:
+            api_key = self.config.openai_api_key
+            if not api_key:
+                raise OpenAIError("OpenAI API key is not configured")
+            self._aclient = _shared_aclient(api_key)
+        return self._aclient
+
+    async def aenhance_changes(self, changes: list[Change]) -> list[Change]:
+        """Enhance changes concurrently with the async client.
+
+        Each change is awaited via asyncio.gather, so total wall time is
+        roughly one round-trip rather than one per change. A failed request
+        yields its original change unmodified.
+        """
+        if not changes or not self.is_available():
             return changes
 
+        # Unbounded gather over hundreds of commits would trip OpenAI
+        # rate limits; a semaphore keeps at most the configured number of
+        # requests in flight while still overlapping their latency.
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
+
+        async def bounded(change: Change) -> Change:
+            async with semaphore:
+                return await self._aenhance_one(change)
+
+        results = await asyncio.gather(
+            *(bounded(change) for change in changes),
+            return_exceptions=True,
+        )
+        enhanced = []
+        for change, result in zip(changes, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error("Failed to enhance change %s: %s", change.commit_hash, result)
+                enhanced.append(change)
+            else:
+                enhanced.append(result)
+        return enhanced
+
+    async def _aenhance_one(self, change: Change) -> Change:
+        """Async mirror of the per-change enhancement call."""
+        prompt = (
+            "Given the following commit message, please provide a more descriptive "
+            "and user-friendly explanation of the changes:\n\n"
+            f"Message: {change.commit_message}\n"
+            f"Description: {change.description}\n\n"
+            "Please provide a concise, clear description that explains the "
+            "purpose and impact of this change."
+        )
+
+        response = await self._get_aclient().chat.completions.create(
+            model=self.config.ai_model,
+            messages=[
+                {"role": "system", "content": _SYS_MSG_CHANGE},
+                {"role": "user", "content": prompt},
+            ],
+        )
+
+        content = response.choices[0].message.content
+        if content is None:
+            logger.warning("Received empty response from OpenAI")
+            return change
+
+        return self._with_description(change, content.strip())
+
+    def _enhance_one(self, change: Change) -> Change:
+        """Enhance a single change with its own completion call.
+
+        Returns the change unmodified on any per-request failure so one
+        bad call doesn't lose the rest of a concurrent batch.
+        """
+        try:
+            return self._enhance_one_inner(change)
+        except OpenAIError as e:
+            logger.error("Failed to enhance change %s: %s", change.commit_hash, e)
+            return change
+
+    def _enhance_one_inner(self, change: Change) -> Change:
+        client = self._get_client()
+        if client is None:
+            return change
+
+        prompt = (
+            "Given the following commit message, please provide a more descriptive "
+            "and user-friendly explanation of the changes:\n\n"
+            f"Message: {change.commit_message}\n"
+            f"Description: {change.description}\n\n"
+            "Please provide a concise, clear description that explains the "
+            "purpose and impact of this change."
+        )
+
+        # Streaming starts delivering tokens as they are generated instead
+        # of blocking until the whole completion is finalized server-side;
+        # for these 1-2 sentence outputs that trims the tail latency of
+        # every call, and multiple streams can be in flight concurrently.
+        stream = client.chat.completions.create(
+            model=self.config.ai_model,
+            messages=[
+                {"role": "system", "content": _SYS_MSG_CHANGE},
+                {"role": "user", "content": prompt},
+            ],
+            stream=True,
+        )
+
+        parts = []
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                parts.append(delta)
+
+        if not parts:
+            logger.warning("Received empty response from OpenAI")
+            return change
+
+        return self._with_description(change, "".join(parts).strip())
+
+    @staticmethod
+    def _with_description(change: Change, description: str) -> Change:
+        """Copy a change with an AI-enhanced description."""
+        return Change(
+            description=description,
+            commit_hash=change.commit_hash,
+            commit_message=change.commit_message,
+            author=change.author,
+            type=change.type,
+            scope=change.scope,
+            breaking=change.breaking,
+            ai_enhanced=True,
+            references=change.references,
+        )
+
     def generate_version_summary(self, version: Version) -> Version:
         """Generate a summary for the version using AI."""
         if not self.is_available():
@@ -98,14 +534,42 @@ class AIService:
             if self._client is None:
                 return version
 
-            # Create a prompt with the version information
-            changes_text = ""
+            # Summaries are keyed by the sorted commit hashes they cover,
+            # so re-drafting the same release reuses the cached text.
+            cache = self._load_cache() if self._use_cache else None
+            summary_key = None
+            if cache is not None:
+                hashes = sorted(
+                    change.commit_hash
+                    for category in version.categories
+                    for change in category.changes
+                )
+                summary_key = self._cache_key("summary|" + ",".join(hashes))
+                cached = cache.get(summary_key)
+                if cached is not None:
+                    version.summary = cached
+                    return version
+
+            # Create a prompt with the version information; join a list of
+            # pieces instead of growing a str with repeated +=. Each
+            # category is capped so prompt size (and token spend) stays
+            # bounded regardless of how large the release is.
+            pieces = []
             for category in version.categories:
                 if not category.changes:
                     continue
-                changes_text += f"\n{category.name}:\n"
-                for change in category.changes:
-                    changes_text += f"- {change.description}\n"
+                pieces.append(f"\n{category.name}:\n")
+                for change in category.changes[:_SUMMARY_CHANGES_PER_CATEGORY]:
+                    pieces.append(f"- {change.description}\n")
+                omitted = len(category.changes) - _SUMMARY_CHANGES_PER_CATEGORY
+                if omitted > 0:
+                    pieces.append(f"- ... and {omitted} more {category.name.lower()} changes\n")
+            changes_text = "".join(pieces)
+            if len(changes_text) // 4 > 3000:
+                logger.warning(
+                    "Version summary prompt is ~%d tokens; consider fewer categories",
+                    len(changes_text) // 4,
+                )
 
             prompt = (
                 "Please provide a concise summary of the following changes "
@@ -119,10 +583,7 @@ class AIService:
             response = self._client.chat.completions.create(
                 model=self.config.ai_model,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant that summarizes software releases."
-                    },
+                    {"role": "system", "content": _SYS_MSG_SUMMARY},
                     {"role": "user", "content": prompt},
                 ],
             )
@@ -133,22 +594,34 @@ class AIService:
                 return version
 
             version.summary = content.strip()
+            if cache is not None and summary_key is not None:
+                cache[summary_key] = version.summary
+                self._save_cache()
             return version
         except OpenAIError as e:
-            logger.error(f"Failed to generate version summary: {e}")
+            logger.error("Failed to generate version summary: %s", e)
             return version
         except Exception as e:
-            logger.error(f"Unexpected error generating version summary: {e}")
+            logger.error("Unexpected error generating version summary: %s", e)
             return version
 
     def is_available(self) -> bool:
-        """Check if the AI service is available."""
+        """Check if the AI service is available.
+
+        The models.list() probe is a full API round-trip, so its result is
+        memoized; enhance/summary paths call this on every entry point and
+        should not each pay for a health check.
+        """
         if not self.config.ai_enabled or not self.config.openai_api_key:
             return False
-        if not self._client:
-            return False
-        try:
-            self._client.models.list()
-            return True
-        except (APIError, AuthenticationError):
+        client = self._get_client()
+        if not client:
             return False
+        if self._available is None:
+            try:
+                client.models.list()
+                self._available = True
+                logger.info("Successfully initialized OpenAI client")
+            except (APIError, AuthenticationError, OpenAIError):
+                self._available = False
+        return self._available
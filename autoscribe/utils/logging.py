@@ -2,20 +2,23 @@
 
 import logging
 import sys
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.logging import RichHandler
-
-# Create default console
-default_console = Console(stderr=True)
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
 def setup_logger(
     name: str = "autoscribe",
     level: int = logging.INFO,
-    console: Console | None = None,
+    console: "Console | None" = None,
 ) -> logging.Logger:
     """Set up a logger with rich formatting."""
+    # Imported here so that merely importing this module (or getting a
+    # logger) doesn't pull in rich.
+    from rich.console import Console
+    from rich.logging import RichHandler
+
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(level)
@@ -25,7 +28,7 @@ def setup_logger(
 
     # Create console if not provided
     if console is None:
-        console = default_console
+        console = Console(stderr=True)
 
     # Create rich handler
     handler = RichHandler(
@@ -47,11 +50,12 @@ def setup_logger(
 
 
 def get_logger(name: str = "autoscribe") -> logging.Logger:
-    """Get an existing logger or create a new one."""
-    logger = logging.getLogger(name)
-    if not logger.handlers:
-        return setup_logger(name)
-    return logger
+    """Get a logger by name without configuring handlers.
+
+    Handler setup is deferred to :func:`setup_logger`, which the CLI
+    invokes once per process when a command actually runs.
+    """
+    return logging.getLogger(name)
 
 
 def log_exception(
@@ -71,7 +75,13 @@ def log_exception(
 
 
 # Get default logger
-logger = get_logger()
+logger = logging.getLogger("autoscribe")
+
+# Standard library pattern: one NullHandler on the package root so that
+# importing autoscribe as a library never warns about missing handlers.
+# Module loggers are "autoscribe.*" children and propagate up to the one
+# handler setup_logger installs; no per-module handlers are ever created.
+logger.addHandler(logging.NullHandler())
 
 
 def info(message: str) -> None:
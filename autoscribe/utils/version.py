@@ -1,7 +1,34 @@
+import functools
+import os
 import re
+import tempfile
 from dataclasses import dataclass
 from enum import Enum
 
+# Compiled once at import; Version.parse is called in a loop when walking
+# tag history, and re-parsing the verbose pattern per call is pure waste.
+_SEMVER_RE = re.compile(
+    r"""
+    ^
+    (?P<major>0|[1-9]\d*)
+    \.
+    (?P<minor>0|[1-9]\d*)
+    \.
+    (?P<patch>0|[1-9]\d*)
+    (?:-(?P<prerelease>(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)
+        (?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?
+    (?:\+(?P<build>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?
+    $
+    """,
+    re.VERBOSE,
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_version_pattern(pattern: str) -> re.Pattern:
+    """Compile a version-file pattern, memoized per pattern string."""
+    return re.compile(pattern.format(version="([^'\"]+)"))
+
 
 class VersionType(str, Enum):
     """Types of version changes."""
@@ -33,19 +60,7 @@ class Version:
     @classmethod
     def parse(cls, version_string: str) -> "Version":
         """Parse a version string into a Version object."""
-        pattern = r"""
-            ^
-            (?P<major>0|[1-9]\d*)
-            \.
-            (?P<minor>0|[1-9]\d*)
-            \.
-            (?P<patch>0|[1-9]\d*)
-            (?:-(?P<prerelease>(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)
-                (?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?
-            (?:\+(?P<build>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?
-            $
-        """
-        match = re.match(pattern, version_string.strip(), re.VERBOSE)
+        match = _SEMVER_RE.match(version_string.strip())
         if not match:
             raise ValueError(f"Invalid version string: {version_string}")
 
@@ -98,26 +113,39 @@ def extract_version(content: str, pattern: str) -> str | None:
 def update_version_in_file(
     file_path: str, new_version: str, pattern: str
 ) -> tuple[bool, str]:
-    """Update version in a file."""
+    """Update version in a file.
+
+    Streams the file line-by-line into a sibling tempfile and swaps it in
+    with os.replace, so memory stays O(line) and a crash mid-write can
+    never leave a half-written file behind.
+    """
+    version_pattern = _compile_version_pattern(pattern)
+    replacement = pattern.format(version=new_version)
+    tmp_path = None
     try:
-        with open(file_path) as f:
-            content = f.read()
-
-        # Create pattern that captures the version part
-        version_pattern = pattern.format(version="([^'\"]+)")
-        replacement = pattern.format(version=new_version)
-
-        if not re.search(version_pattern, content):
+        directory = os.path.dirname(os.path.abspath(file_path))
+        replaced = 0
+        with open(file_path) as src:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as dst:
+                for line in src:
+                    line, count = version_pattern.subn(replacement, line)
+                    replaced += count
+                    dst.write(line)
+
+        if not replaced:
+            os.unlink(tmp_path)
             return False, f"Version pattern not found in {file_path}"
 
-        updated_content = re.sub(version_pattern, replacement, content)
-
-        with open(file_path, "w") as f:
-            f.write(updated_content)
-
+        os.replace(tmp_path, file_path)
         return True, f"Updated version to {new_version} in {file_path}"
 
     except Exception as e:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
         return False, f"Failed to update version: {str(e)}"
 
 
@@ -1,5 +1,7 @@
 import os
+from collections import Counter
 from collections.abc import Generator
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
@@ -10,42 +12,52 @@ from openai import OpenAIError
 from autoscribe.models.config import AutoScribeConfig
 
 
-class MockGithubRelease:
-    @property
-    def id(self) -> int:
-        return 1
+def pytest_configure(config):
+    """Route temporary directories to tmpfs when the host has one.
+
+    The changelog and version-file tests do real write/replace/read
+    roundtrips under ``tmp_path``; backing those with /dev/shm keeps the
+    I/O in memory instead of hitting disk on every test. Explicit
+    TMPDIR/--basetemp settings are left alone.
+    """
+    import tempfile
 
-    @property
-    def html_url(self) -> str:
-        return "https://github.com/test/repo/releases/v1.0.0"
+    if (
+        config.option.basetemp is None
+        and "TMPDIR" not in os.environ
+        and os.path.isdir("/dev/shm")
+        and os.access("/dev/shm", os.W_OK)
+    ):
+        os.environ["TMPDIR"] = "/dev/shm"
+        tempfile.tempdir = None  # force gettempdir() to re-read TMPDIR
 
-    @property
-    def tag_name(self) -> str:
-        return "v1.0.0"
 
-    @property
-    def title(self) -> str:
-        return "Release v1.0.0"
+def pytest_collection_modifyitems(items):
+    """Guard against the same test being collected more than once.
 
-    @property
-    def body(self) -> str:
-        return "Test release notes"
+    Duplicated test modules sneaking back into the tree (or packaging
+    mistakes that make pytest collect a file twice) silently multiply
+    suite runtime; fail collection instead.
+    """
+    counts = Counter(item.nodeid for item in items)
+    duplicates = sorted(nodeid for nodeid, count in counts.items() if count > 1)
+    assert not duplicates, f"Tests collected more than once: {duplicates}"
 
-    @property
-    def draft(self) -> bool:
-        return False
 
-    @property
-    def prerelease(self) -> bool:
-        return False
+class MockGithubRelease:
+    """Canned release; constant class attributes, no per-access property calls."""
 
-    @property
-    def created_at(self) -> str:
-        return "2024-01-01T00:00:00Z"
+    __slots__ = ()
 
-    @property
-    def published_at(self) -> str:
-        return "2024-01-01T00:00:00Z"
+    id = 1
+    html_url = "https://github.com/test/repo/releases/v1.0.0"
+    tag_name = "v1.0.0"
+    title = "Release v1.0.0"
+    body = "Test release notes"
+    draft = False
+    prerelease = False
+    created_at = "2024-01-01T00:00:00Z"
+    published_at = "2024-01-01T00:00:00Z"
 
     def update_release(self, **kwargs) -> None:
         pass
@@ -54,25 +66,30 @@ class MockGithubRelease:
         pass
 
 
+_GITHUB_RELEASE = MockGithubRelease()
+
+
 class MockGithubRepo:
+    __slots__ = ()
+
     def create_git_release(self, **kwargs) -> MockGithubRelease:
-        return MockGithubRelease()
+        return _GITHUB_RELEASE
 
     def get_release(self, id_or_tag) -> MockGithubRelease:
-        return MockGithubRelease()
+        return _GITHUB_RELEASE
 
     def get_release_by_tag(self, tag) -> MockGithubRelease:
-        return MockGithubRelease()
+        return _GITHUB_RELEASE
 
 
 class MockGithubUser:
-    @property
-    def login(self) -> str:
-        return "test-user"
+    __slots__ = ()
+
+    login = "test-user"
 
 
 class MockGithub:
-    def __init__(self, token: str | None = None):
+    def __init__(self, token: str | None = None, **kwargs):
         self.token = token
 
     def get_user(self) -> MockGithubUser:
@@ -86,29 +103,68 @@ class MockGithub:
         return MockGithubRepo()
 
 
+@dataclass(frozen=True, slots=True)
 class MockOpenAIMessage:
-    def __init__(self, content: str):
-        self.content = content
-        self.role = "assistant"
+    content: str
+    role: str = "assistant"
 
 
+@dataclass(frozen=True, slots=True)
 class MockOpenAIChoice:
-    def __init__(self, content: str):
-        self.message = MockOpenAIMessage(content)
-        self.finish_reason = "stop"
-        self.index = 0
+    message: MockOpenAIMessage
+    finish_reason: str = "stop"
+    index: int = 0
 
 
+@dataclass(frozen=True, slots=True)
 class MockOpenAIResponse:
-    def __init__(self, content: str):
-        self.id = "test-id"
-        self.choices = [MockOpenAIChoice(content)]
-        self.model = "gpt-4"
+    choices: tuple[MockOpenAIChoice, ...]
+    id: str = "test-id"
+    model: str = "gpt-4"
+
+
+def _make_response(content: str) -> MockOpenAIResponse:
+    return MockOpenAIResponse(choices=(MockOpenAIChoice(MockOpenAIMessage(content)),))
+
+
+# The responses are immutable, so one prebuilt instance serves every
+# mocked call instead of reallocating the message/choice graph per call.
+_ENHANCED_RESPONSE = _make_response("Enhanced description")
+
+
+@dataclass(frozen=True, slots=True)
+class MockOpenAIDelta:
+    content: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class MockOpenAIStreamChoice:
+    delta: MockOpenAIDelta
+    index: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class MockOpenAIChunk:
+    choices: tuple[MockOpenAIStreamChoice, ...]
+
+
+_ENHANCED_STREAM_CHUNKS = (
+    MockOpenAIChunk(choices=(MockOpenAIStreamChoice(MockOpenAIDelta("Enhanced ")),)),
+    MockOpenAIChunk(choices=(MockOpenAIStreamChoice(MockOpenAIDelta("description")),)),
+    MockOpenAIChunk(choices=(MockOpenAIStreamChoice(MockOpenAIDelta(None)),)),
+)
+
+
+class MockOpenAICompletions:
+    def create(self, *args, **kwargs):
+        if kwargs.get("stream"):
+            return iter(_ENHANCED_STREAM_CHUNKS)
+        return _ENHANCED_RESPONSE
 
 
 class MockOpenAIChat:
-    def create(self, *args, **kwargs) -> MockOpenAIResponse:
-        return MockOpenAIResponse("Enhanced description")
+    def __init__(self):
+        self.completions = MockOpenAICompletions()
 
 
 class MockOpenAIModels:
@@ -117,7 +173,7 @@ class MockOpenAIModels:
 
 
 class MockOpenAI:
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, **kwargs):
         if not api_key or api_key == "invalid-key":
             raise OpenAIError("Invalid API key")
         self.api_key = api_key
@@ -125,134 +181,238 @@ class MockOpenAI:
         self.models = MockOpenAIModels()
 
 
+class MockAsyncOpenAICompletions:
+    async def create(self, *args, **kwargs) -> MockOpenAIResponse:
+        return _ENHANCED_RESPONSE
+
+
+class MockAsyncOpenAIChat:
+    def __init__(self):
+        self.completions = MockAsyncOpenAICompletions()
+
+
+class MockAsyncOpenAI:
+    def __init__(self, api_key: str | None = None, **kwargs):
+        if not api_key or api_key == "invalid-key":
+            raise OpenAIError("Invalid API key")
+        self.api_key = api_key
+        self.chat = MockAsyncOpenAIChat()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point the on-disk caches at a per-test directory.
+
+    The AI response and config caches key off XDG_CACHE_HOME; without
+    this, test runs would read and write the developer's real cache and
+    earlier runs could short-circuit the code paths under test.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
 @pytest.fixture
 def temp_dir(tmp_path: Path) -> Path:
     """Provide a temporary directory for tests."""
     return tmp_path
 
 
+@pytest.fixture(scope="session")
+def scratch(tmp_path_factory) -> Path:
+    """Shared scratch directory, created once per session.
+
+    For tests that only need somewhere writable and can pick their own
+    unique file names; saves the per-test mkdtemp that tmp_path does.
+    """
+    return tmp_path_factory.mktemp("scratch")
+
+
+# Path-independent sample settings, built once; sample_config only adds
+# the per-test tmp paths on top, so each test revalidates two fields
+# instead of the whole model.
+_SAMPLE_CONFIG_BASE = {
+    "version_pattern": "version = '{version}'",
+    "categories": [
+        "Added",
+        "Changed",
+        "Fixed",
+        "Documentation",
+    ],
+    "github_release": True,
+    "github_token": "test-token",
+    "ai_enabled": True,
+    "ai_model": "gpt-4",
+    "openai_api_key": "test-key",
+}
+
+
 @pytest.fixture
 def sample_config(temp_dir: Path) -> AutoScribeConfig:
     """Provide a sample configuration for tests."""
     return AutoScribeConfig(
+        **_SAMPLE_CONFIG_BASE,
         output=temp_dir / "CHANGELOG.md",
         version_file=temp_dir / "pyproject.toml",
-        version_pattern="version = '{version}'",
-        categories=[
-            "Added",
-            "Changed",
-            "Fixed",
-            "Documentation",
-        ],
-        github_release=True,
-        github_token="test-token",
-        ai_enabled=True,
-        ai_model="gpt-4",
-        openai_api_key="test-key",
     )
 
 
-@pytest.fixture
-def git_repo(temp_dir: Path) -> Generator[Path, None, None]:
-    """Create a temporary Git repository for tests."""
-    import subprocess
-
-    # Initialize Git repo
-    subprocess.run(["git", "init"], cwd=temp_dir, check=True, capture_output=True)
+@pytest.fixture(scope="session", autouse=True)
+def _git_config_sandbox(tmp_path_factory: pytest.TempPathFactory) -> Generator[None, None, None]:
+    """Point every git subprocess in the session at a tiny prepared config.
 
-    # Configure Git globally for this process
-    subprocess.run(
-        ["git", "config", "--global", "user.name", "Test User"],
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "--global", "user.email", "test@example.com"],
-        check=True,
-        capture_output=True,
+    GitService runs real git commands that inherit os.environ; without
+    this they stat and parse the host's global/system config on every
+    call, and host settings (hooks, defaultBranch, signing) could leak
+    into test behavior. One session-scoped env push replaces any per-test
+    HOME juggling.
+    """
+    gitconfig = tmp_path_factory.mktemp("gitconfig") / "config"
+    gitconfig.write_text(
+        "[user]\n\tname = Test User\n\temail = test@example.com\n"
     )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("GIT_CONFIG_GLOBAL", str(gitconfig))
+        mp.setenv("GIT_CONFIG_SYSTEM", os.devnull)
+        mp.setenv("GIT_CONFIG_NOSYSTEM", "1")
+        yield
 
-    # Configure Git locally for this repo
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=temp_dir,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"],
-        cwd=temp_dir,
-        check=True,
-        capture_output=True,
-    )
 
-    # Create initial commit
-    (temp_dir / "README.md").write_text("# Test Repository")
-    subprocess.run(
-        ["git", "add", "README.md"],
-        cwd=temp_dir,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
-        cwd=temp_dir,
-        check=True,
-        capture_output=True,
-    )
+# Environment for the fixture git invocations: author/committer identity
+# comes from the environment and global/system config is masked, so tests
+# never read from or write to the host's ~/.gitconfig.
+GIT_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "Test User",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test User",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+    "GIT_CONFIG_GLOBAL": os.devnull,
+    "GIT_CONFIG_SYSTEM": os.devnull,
+}
 
-    yield temp_dir
 
-    # Cleanup
-    import shutil
-    shutil.rmtree(temp_dir / ".git")
+_FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Unpack the pristine template repository once per session.
+
+    The template is a checked-in tarball of a minimal repo (one commit,
+    identity in its local config), so the bootstrap is a pure in-process
+    tar extraction — no git subprocesses at all. Tests never touch this
+    copy; git_repo clones it per test with a cheap directory copy.
+    """
+    import tarfile
+
+    template = tmp_path_factory.mktemp("git_template")
+    with tarfile.open(_FIXTURES_DIR / "minimal_repo.tar") as tf:
+        tf.extractall(template)
+    return template
 
 
 @pytest.fixture
-def sample_commits(git_repo: Path) -> Generator[list[str], None, None]:
-    """Create sample commits in the repository."""
+def git_repo(temp_dir: Path, _git_repo_template: Path) -> Path:
+    """Create a temporary Git repository for tests."""
+    import shutil
+
+    shutil.copytree(_git_repo_template, temp_dir, dirs_exist_ok=True)
+    return temp_dir
+
+
+SAMPLE_COMMIT_MESSAGES = [
+    "feat: add new feature",
+    "fix: resolve critical bug",
+    "docs: update documentation",
+    "feat!: breaking change",
+    "chore: cleanup code",
+]
+
+
+@pytest.fixture(scope="session")
+def _sample_commits_template(
+    _git_repo_template: Path, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Extend the template repo with the sample commits, once per session.
+
+    The whole commit chain is fed to one ``git fast-import`` run: a single
+    subprocess creates every blob, tree and commit and moves the branch,
+    instead of one ``git commit`` (index write + ref update) per message.
+    """
+    import shutil
     import subprocess
 
-    commits = [
-        "feat: add new feature",
-        "fix: resolve critical bug",
-        "docs: update documentation",
-        "feat!: breaking change",
-        "chore: cleanup code",
-    ]
-
-    for i, commit in enumerate(commits, 1):
-        # Create a dummy file for each commit
-        file_name = f"file_{i}.txt"
-        (git_repo / file_name).write_text("dummy content")
-        subprocess.run(
-            ["git", "add", file_name],
-            cwd=git_repo,
-            check=True,
+    template = tmp_path_factory.mktemp("git_commits_template")
+    shutil.copytree(_git_repo_template, template, dirs_exist_ok=True)
+
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args],
+            cwd=template,
+            env=GIT_ENV,
             capture_output=True,
-        )
-        subprocess.run(
-            ["git", "commit", "-m", commit],
-            cwd=git_repo,
+            text=True,
             check=True,
-            capture_output=True,
-        )
+        ).stdout.strip()
+
+    parent = git("rev-parse", "HEAD")
+    branch = git("rev-parse", "--abbrev-ref", "HEAD")
+
+    ident = b"Test User <test@example.com> 1704067200 +0000"
+    blob = b"dummy content"
+    stream = [b"blob\nmark :1\ndata %d\n%s\n" % (len(blob), blob)]
+    for i, message in enumerate(SAMPLE_COMMIT_MESSAGES, 1):
+        (template / f"file_{i}.txt").write_bytes(blob)
+        msg = message.encode()
+        stream.append(b"commit refs/heads/%s\n" % branch.encode())
+        stream.append(b"author %s\ncommitter %s\n" % (ident, ident))
+        stream.append(b"data %d\n%s\n" % (len(msg), msg))
+        if i == 1:
+            # Attach to the template's existing history; later commits
+            # chain on the branch tip implicitly.
+            stream.append(b"from %s\n" % parent.encode())
+        stream.append(b"M 100644 :1 file_%d.txt\n\n" % i)
 
-    yield commits
+    subprocess.run(
+        ["git", "fast-import", "--quiet"],
+        cwd=template,
+        env=GIT_ENV,
+        input=b"".join(stream),
+        capture_output=True,
+        check=True,
+    )
+    # fast-import bypasses the index; sync it so the copies start clean.
+    git("read-tree", "HEAD")
+    return template
 
 
 @pytest.fixture
+def sample_commits(git_repo: Path, _sample_commits_template: Path) -> list[str]:
+    """Create sample commits in the repository."""
+    import shutil
+
+    shutil.rmtree(git_repo / ".git")
+    shutil.copytree(_sample_commits_template, git_repo, dirs_exist_ok=True)
+    return list(SAMPLE_COMMIT_MESSAGES)
+
+
+@pytest.fixture(scope="session")
 def mock_github():
     """Provide a mock GitHub client."""
     return MockGithub
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_openai():
     """Provide a mock OpenAI client."""
     return MockOpenAI
 
 
+@pytest.fixture(scope="session")
+def mock_async_openai():
+    """Provide a mock async OpenAI client."""
+    return MockAsyncOpenAI
+
+
 @pytest.fixture
 def env_vars(request: FixtureRequest) -> Generator[None, None, None]:
     """Set environment variables for tests."""
@@ -0,0 +1,49 @@
+"""Factories for known-valid model instances used as test fixtures.
+
+These build ``Change``/``Category``/``Version`` via ``model_construct``,
+which skips Pydantic validation entirely — the literals passed by the
+tests are known valid, and the model tests in ``test_changelog_model.py``
+keep exercising the validated constructors. ``model_construct`` does not
+apply field defaults, so each factory fills in the optional fields itself
+(building fresh lists per call).
+"""
+
+from datetime import datetime
+from typing import Any
+
+from autoscribe.models.changelog import Category, Change, Version
+
+# Fixed timestamp shared by every factory-built Version; tests that
+# care about ordering pass their own dates.
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def mk_change(**kwargs: Any) -> Change:
+    """Build a Change without running validation."""
+    fields: dict[str, Any] = {
+        "scope": None,
+        "breaking": False,
+        "ai_enhanced": False,
+        "references": [],
+        **kwargs,
+    }
+    return Change.model_construct(**fields)
+
+
+def mk_category(**kwargs: Any) -> Category:
+    """Build a Category without running validation."""
+    return Category.model_construct(**{"changes": [], **kwargs})
+
+
+def mk_version(**kwargs: Any) -> Version:
+    """Build a Version without running validation."""
+    fields: dict[str, Any] = {
+        "date": _NOW,
+        "categories": [],
+        "summary": None,
+        "breaking_changes": False,
+        "yanked": False,
+        "compare_url": None,
+        **kwargs,
+    }
+    return Version.model_construct(**fields)
@@ -0,0 +1,33 @@
+"""Fixtures shared by the integration tests."""
+
+import pytest
+
+from autoscribe.core.git import GitCommandError, GitService
+
+
+@pytest.fixture
+def fake_git(monkeypatch):
+    """Run GitService against canned git output instead of subprocesses.
+
+    Tests that exercise GitService's parsing and caching logic don't need
+    a real repository; this patches ``_run_command`` with a dispatch table
+    matched by argv prefix, collapsing process spawns to in-process calls.
+    Returns a ``respond(*argv_prefix, output=...)`` function for tests to
+    record outputs; unmatched commands raise ``GitCommandError`` like a
+    failing git invocation would.
+    """
+    outputs: dict[tuple[str, ...], str] = {}
+
+    def respond(*argv_prefix: str, output: str = "") -> None:
+        outputs[tuple(argv_prefix)] = output
+
+    def fake_run(self, argv):
+        for prefix, output in outputs.items():
+            if tuple(argv[: len(prefix)]) == prefix:
+                return output
+        raise GitCommandError(f"Git command failed: {argv}")
+
+    # Every GitService constructor validates the repo with rev-parse.
+    respond("git", "rev-parse", output=".git\n/fake/repo")
+    monkeypatch.setattr(GitService, "_run_command", fake_run)
+    return respond
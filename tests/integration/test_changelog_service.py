@@ -1,4 +1,4 @@
-from unittest.mock import patch
+import pytest
 
 from autoscribe.core.changelog import ChangelogService
 from autoscribe.core.git import GitService
@@ -7,6 +7,15 @@ from autoscribe.models.config import AutoScribeConfig
 from autoscribe.services.openai import AIService
 
 
+@pytest.fixture(autouse=True, scope="module")
+def _patch_openai(mock_openai, mock_async_openai):
+    """Patch the service's OpenAI bindings once for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("autoscribe.services.openai.OpenAI", mock_openai)
+        mp.setattr("autoscribe.services.openai.AsyncOpenAI", mock_async_openai)
+        yield
+
+
 def test_changelog_service_initialization(sample_config, git_repo):
     """Test ChangelogService initialization."""
     git_service = GitService(str(git_repo))
@@ -27,22 +36,21 @@ def test_generate_version_without_ai(sample_config, git_repo, sample_commits):
     assert len(version.categories) > 0
 
 
-def test_generate_version_with_ai(git_repo, sample_commits, mock_openai):
+def test_generate_version_with_ai(git_repo, sample_commits):
     """Test version generation with AI enhancement."""
     config = AutoScribeConfig(ai_enabled=True, openai_api_key="test-key")
     git_service = GitService(str(git_repo))
-    with patch("openai.OpenAI", mock_openai):
-        ai_service = AIService(config)
-        service = ChangelogService(config, git_service, ai_service)
+    ai_service = AIService(config)
+    service = ChangelogService(config, git_service, ai_service)
 
-        version = service.generate_version("1.0.0")
-        assert isinstance(version, Version)
-        assert version.number == "1.0.0"
-        assert version.summary == "Enhanced description"
+    version = service.generate_version("1.0.0")
+    assert isinstance(version, Version)
+    assert version.number == "1.0.0"
+    assert version.summary == "Enhanced description"
 
 
 def test_add_version(sample_config, git_repo, sample_commits):
-    """Test adding a version to the changelog."""
+    """Test that adding a version creates and fills the changelog file."""
     git_service = GitService(str(git_repo))
     service = ChangelogService(sample_config, git_service)
 
@@ -50,8 +58,9 @@ def test_add_version(sample_config, git_repo, sample_commits):
     service.add_version(version)
 
     assert sample_config.output.exists()
-    assert "# Changelog" in sample_config.output.read_text()
-    assert "## 1.0.0" in sample_config.output.read_text()
+    content = sample_config.output.read_text()
+    assert "# Changelog" in content
+    assert "## [1.0.0]" in content
 
 
 def test_version_management(sample_config, git_repo, sample_commits):
@@ -68,22 +77,6 @@ def test_version_management(sample_config, git_repo, sample_commits):
     service.add_version(version2)
 
     content = sample_config.output.read_text()
-    assert "## 1.1.0" in content
-    assert "## 1.0.0" in content
-    assert content.index("## 1.1.0") < content.index("## 1.0.0")
-
-
-def test_changelog_file_creation(sample_config, git_repo, sample_commits):
-    """Test changelog file creation."""
-    git_service = GitService(str(git_repo))
-    service = ChangelogService(sample_config, git_service)
-
-    # Generate and add version
-    version = service.generate_version("1.0.0")
-    service.add_version(version)
-
-    # Check file creation
-    assert sample_config.output.exists()
-    content = sample_config.output.read_text()
-    assert "# Changelog" in content
-    assert "## 1.0.0" in content
+    assert "## [1.1.0]" in content
+    assert "## [1.0.0]" in content
+    assert content.index("## [1.1.0]") < content.index("## [1.0.0]")
@@ -1,6 +1,4 @@
-import os
 from datetime import datetime
-from pathlib import Path
 
 import pytest
 
@@ -8,7 +6,8 @@ from autoscribe.core.git import GitCommandError, GitInitError, GitService
 from autoscribe.models.changelog import Change
 
 
-def test_git_service_initialization(git_repo):
+@pytest.mark.slow
+def test_git_service_initialization(git_repo, tmp_path_factory, monkeypatch):
     """Test GitService initialization."""
     service = GitService(str(git_repo))
     assert service.repo_path == str(git_repo)
@@ -18,25 +17,19 @@ def test_git_service_initialization(git_repo):
     with pytest.raises(GitInitError):
         GitService("/non/existent/path")
 
-    # Test with non-git directory
-    temp_dir = Path(git_repo).parent / "temp"
-    temp_dir.mkdir(exist_ok=True)
-    try:
-        with pytest.raises(GitInitError):
-            GitService(str(temp_dir))
-    finally:
-        temp_dir.rmdir()
+    # Test with non-git directory (a fresh basetemp dir, so it isn't
+    # nested inside any repository rev-parse could walk up to)
+    non_git = tmp_path_factory.mktemp("not-a-repo")
+    with pytest.raises(GitInitError):
+        GitService(str(non_git))
 
     # Test with None (current directory)
-    current_dir = os.getcwd()
-    os.chdir(str(git_repo))
-    try:
-        service = GitService()
-        assert service.repo_path == str(git_repo)
-    finally:
-        os.chdir(current_dir)
+    monkeypatch.chdir(git_repo)
+    service = GitService()
+    assert service.repo_path == str(git_repo)
 
 
+@pytest.mark.slow
 def test_get_commits_since_tag(git_repo, sample_commits):
     """Test getting commits since tag."""
     service = GitService(str(git_repo))
@@ -50,67 +43,49 @@ def test_get_commits_since_tag(git_repo, sample_commits):
     assert commits == []
 
 
-def test_get_latest_tag(git_repo):
+def test_get_latest_tag(fake_git):
     """Test getting latest tag."""
-    service = GitService(str(git_repo))
+    service = GitService("/fake/repo")
     assert service.get_latest_tag() is None
 
-    # Create a tag
-    service.create_tag("v1.0.0", "Release v1.0.0")
+    # One tag
+    fake_git("git", "tag", output="v1.0.0")
+    service._query_cache.clear()
     assert service.get_latest_tag() == "v1.0.0"
 
-    # Create another tag
-    service.create_tag("v1.1.0", "Release v1.1.0")
+    # git returns tags version-sorted, newest first
+    fake_git("git", "tag", output="v1.1.0\nv1.0.0")
+    service._query_cache.clear()
     assert service.get_latest_tag() == "v1.1.0"
 
 
-def test_parse_conventional_commit(git_repo):
+PARSE_CASES = [
+    ("feat(api): add new endpoint", ("feat", "api", "add new endpoint", False)),
+    ("feat!: breaking feature", ("feat", None, "breaking feature", True)),
+    (
+        "feat: feature\n\nBREAKING CHANGE: breaks stuff",
+        ("feat", None, "feature", True),
+    ),
+    ("random commit message", ("other", None, "random commit message", False)),
+]
+
+
+@pytest.mark.parametrize(("message", "expected"), PARSE_CASES)
+def test_parse_conventional_commit(git_repo, message, expected):
     """Test parsing conventional commit messages."""
     service = GitService(str(git_repo))
+    assert service.parse_conventional_commit(message) == expected
 
-    # Test feature commit
-    type_, scope, desc, breaking = service.parse_conventional_commit(
-        "feat(api): add new endpoint"
-    )
-    assert type_ == "feat"
-    assert scope == "api"
-    assert desc == "add new endpoint"
-    assert not breaking
-
-    # Test breaking change with !
-    type_, scope, desc, breaking = service.parse_conventional_commit(
-        "feat!: breaking feature"
-    )
-    assert type_ == "feat"
-    assert scope is None
-    assert desc == "breaking feature"
-    assert breaking
-
-    # Test breaking change in body
-    type_, scope, desc, breaking = service.parse_conventional_commit(
-        "feat: feature\n\nBREAKING CHANGE: breaks stuff"
-    )
-    assert type_ == "feat"
-    assert scope is None
-    assert desc == "feature"
-    assert breaking
-
-    # Test non-conventional commit
-    type_, scope, desc, breaking = service.parse_conventional_commit(
-        "random commit message"
-    )
-    assert type_ == "other"
-    assert scope is None
-    assert desc == "random commit message"
-    assert not breaking
-
-    # Test all conventional types
+
+def test_parse_conventional_commit_known_types(git_repo):
+    """Every mapped conventional type parses back to itself."""
+    service = GitService(str(git_repo))
     for type_ in GitService.CONVENTIONAL_TYPES:
-        msg = f"{type_}: test message"
-        parsed_type, _, _, _ = service.parse_conventional_commit(msg)
+        parsed_type, _, _, _ = service.parse_conventional_commit(f"{type_}: test message")
         assert parsed_type == type_
 
 
+@pytest.mark.slow
 def test_create_change_from_commit(git_repo, sample_commits):
     """Test creating Change from GitCommit."""
     service = GitService(str(git_repo))
@@ -126,6 +101,7 @@ def test_create_change_from_commit(git_repo, sample_commits):
         assert isinstance(change.references, list)
 
 
+@pytest.mark.slow
 def test_tag_operations(git_repo):
     """Test tag creation and pushing."""
     service = GitService(str(git_repo))
@@ -151,38 +127,33 @@ def test_tag_operations(git_repo):
         service.push_tag("non-existent-tag")
 
 
-def test_remote_operations(git_repo):
-    """Test remote URL operations."""
-    service = GitService(str(git_repo))
-
-    # Test without remote
-    assert service.get_remote_url() is None
-    owner, repo = service.extract_repo_info()
-    assert owner is None
-    assert repo is None
+REMOTE_CASES = [
+    (None, None, None),
+    ("https://github.com/test/repo.git", "test", "repo"),
+    ("git@github.com:test/repo.git", "test", "repo"),
+]
 
-    # Add HTTPS remote
-    service._run_command("git remote add origin https://github.com/test/repo.git")
-    assert service.get_remote_url() == "https://github.com/test/repo.git"
-    owner, repo = service.extract_repo_info()
-    assert owner == "test"
-    assert repo == "repo"
 
-    # Change to SSH remote
-    service._run_command("git remote set-url origin git@github.com:test/repo.git")
-    assert service.get_remote_url() == "git@github.com:test/repo.git"
-    owner, repo = service.extract_repo_info()
-    assert owner == "test"
-    assert repo == "repo"
+@pytest.mark.parametrize(("url", "owner", "repo"), REMOTE_CASES)
+def test_remote_operations(fake_git, url, owner, repo):
+    """Test remote URL operations."""
+    # The remote URL is memoized per instance, so each case builds its own
+    # service; the None case leaves no remote configured.
+    if url is not None:
+        fake_git("git", "config", "--get", "remote.origin.url", output=url)
+    service = GitService("/fake/repo")
+    assert service.get_remote_url() == url
+    assert service.extract_repo_info() == (owner, repo)
 
 
+@pytest.mark.slow
 def test_error_handling(git_repo):
     """Test error handling."""
     service = GitService(str(git_repo))
 
     # Test invalid command
     with pytest.raises(GitCommandError):
-        service._run_command("git invalid-command")
+        service._run_command(["git", "invalid-command"])
 
     # Test invalid tag
     with pytest.raises(GitCommandError):
@@ -193,8 +164,8 @@ def test_error_handling(git_repo):
         service.push_tag("v1.0.0")
 
     # Test command with stderr output but success
-    result = service._run_command("git status")
+    result = service._run_command(["git", "status"])
     assert isinstance(result, str)
 
     # Test command with both stdout and stderr
-    service._run_command("git init")  # This often produces both stdout and stderr
+    service._run_command(["git", "init"])  # This often produces both stdout and stderr
@@ -5,6 +5,8 @@ from pydantic import ValidationError
 
 from autoscribe.models.changelog import Category, Change, Changelog, Version
 
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
 
 def test_change_model():
     """Test Change model."""
@@ -87,18 +89,21 @@ def test_category_model():
     with pytest.raises(ValidationError):
         Category(name="Invalid")
 
-    # Test all valid categories
-    valid_categories = ["Added", "Changed", "Deprecated", "Removed", "Fixed", "Security"]
-    for name in valid_categories:
-        category = Category(name=name)
-        assert category.name == name
-        assert category.changes == []
+
+@pytest.mark.parametrize(
+    "name", ["Added", "Changed", "Deprecated", "Removed", "Fixed", "Security"]
+)
+def test_category_accepts_valid_name(name):
+    """Each Keep a Changelog standard name passes validation."""
+    category = Category(name=name)
+    assert category.name == name
+    assert category.changes == []
 
 
 def test_version_model():
     """Test Version model."""
     # Test valid version
-    now = datetime.now()
+    now = _NOW
     categories = [
         Category(
             name="Added",
@@ -161,7 +166,7 @@ def test_version_model():
 def test_changelog_model():
     """Test Changelog model."""
     # Test valid changelog
-    now = datetime.now()
+    now = _NOW
     version = Version(
         number="1.0.0",
         date=now,
@@ -195,7 +200,7 @@ def test_changelog_model():
 
     # Test defaults
     changelog = Changelog()
-    assert changelog.versions == []
+    assert list(changelog.versions) == []
     assert changelog.title == "Changelog"
     assert "Keep a Changelog" in changelog.description
     assert "Semantic Versioning" in changelog.description
@@ -205,7 +210,7 @@ def test_changelog_model():
 def test_changelog_methods():
     """Test Changelog methods."""
     changelog = Changelog()
-    now = datetime.now()
+    now = _NOW
 
     # Test add_version
     version1 = Version(number="1.0.0", date=now - timedelta(days=1))
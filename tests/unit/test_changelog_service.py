@@ -1,77 +1,117 @@
 from datetime import datetime
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
 from autoscribe.core.changelog import ChangelogService
-from autoscribe.core.git import GitCommit, GitService
-from autoscribe.models.changelog import Category, Change, Version
+from autoscribe.core.git import GitCommit
 from autoscribe.models.config import AutoScribeConfig
-from autoscribe.services.openai import AIService
+from tests.factories import mk_category, mk_change, mk_version
+
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# Canonical feat/fix/breaking-feat input for categorization tests, built
+# once; the service treats changes as immutable, so tests pass a shallow
+# list(...) copy.
+_CANONICAL_CHANGES = (
+    mk_change(
+        description="add feature",
+        commit_hash="abc123",
+        commit_message="feat: add feature",
+        author="Test User",
+        type="feat",
+    ),
+    mk_change(
+        description="fix bug",
+        commit_hash="def456",
+        commit_message="fix: fix bug",
+        author="Test User",
+        type="fix",
+    ),
+    mk_change(
+        description="breaking change",
+        commit_hash="ghi789",
+        commit_message="feat!: breaking change",
+        author="Test User",
+        type="feat",
+        breaking=True,
+    ),
+)
 
 
 @pytest.fixture
-def config():
-    """Create a test configuration."""
+def config(tmp_path):
+    """Create a test configuration writing under tmp_path.
+
+    Keeping the output inside tmp_path (tmpfs-backed where available)
+    stops add_version tests from touching the working tree's own
+    CHANGELOG.md.
+    """
     return AutoScribeConfig(
-        output="CHANGELOG.md",
+        output=tmp_path / "CHANGELOG.md",
         categories=["Added", "Changed", "Fixed"],
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def git_service():
-    """Create a mock git service."""
-    service = MagicMock(spec=GitService)
-    service.get_latest_tag.return_value = "v1.0.0"
-    service.get_commits_since_tag.return_value = [
+    """Stub git service.
+
+    No test in this file asserts on call records, so a plain namespace of
+    canned callables is all ChangelogService needs — there is no MagicMock
+    spec introspection to pay for. Module-scoped: the stub is stateless.
+    """
+    commits = [
         GitCommit(
             hash="abc123",
             message="feat: add feature",
             author="Test User",
-            date=datetime.now(),
+            date=_NOW,
         ),
         GitCommit(
             hash="def456",
             message="fix: fix bug",
             author="Test User",
-            date=datetime.now(),
+            date=_NOW,
         ),
     ]
-    service.create_change_from_commit.side_effect = lambda commit: Change(
-        description=commit.message.split(": ")[1],
-        commit_hash=commit.hash,
-        commit_message=commit.message,
-        author=commit.author,
-        type=commit.message.split(": ")[0],
+    return SimpleNamespace(
+        get_latest_tag=lambda: "v1.0.0",
+        get_commits_since_tag=lambda tag=None: commits,
+        create_change_from_commit=lambda commit: mk_change(
+            description=commit.message.split(": ")[1],
+            commit_hash=commit.hash,
+            commit_message=commit.message,
+            author=commit.author,
+            type=commit.message.split(": ")[0],
+        ),
     )
-    return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ai_service():
-    """Create a mock AI service."""
-    service = MagicMock(spec=AIService)
-    service.is_available.return_value = True
-    service.enhance_changes.side_effect = lambda changes: [
-        Change(
-            description=f"Enhanced: {change.description}",
-            commit_hash=change.commit_hash,
-            commit_message=change.commit_message,
-            author=change.author,
-            type=change.type,
-            ai_enhanced=True,
-        )
-        for change in changes
-    ]
-    service.generate_version_summary.side_effect = lambda version: Version(
-        number=version.number,
-        date=version.date,
-        categories=version.categories,
-        summary="AI generated summary",
-        breaking_changes=version.breaking_changes,
+    """Stub AI service (a plain namespace, like git_service)."""
+    return SimpleNamespace(
+        is_available=lambda: True,
+        enhance_changes=lambda changes: [
+            mk_change(
+                description=f"Enhanced: {change.description}",
+                commit_hash=change.commit_hash,
+                commit_message=change.commit_message,
+                author=change.author,
+                type=change.type,
+                ai_enhanced=True,
+            )
+            for change in changes
+        ],
+        generate_version_summary=lambda version: mk_version(
+            number=version.number,
+            date=version.date,
+            categories=version.categories,
+            summary="AI generated summary",
+            breaking_changes=version.breaking_changes,
+        ),
     )
-    return service
 
 
 @pytest.fixture
@@ -80,15 +120,15 @@ def changelog_service(config, git_service, ai_service):
     return ChangelogService(config, git_service, ai_service)
 
 
-def test_load_or_create_changelog(tmp_path, config, git_service):
+def test_load_or_create_changelog(scratch, config, git_service):
     """Test loading or creating a changelog."""
     # Test creating new changelog
     service = ChangelogService(config, git_service)
     assert service.changelog is not None
     assert len(service.changelog.versions) == 0
 
-    # Test loading existing changelog
-    changelog_path = tmp_path / "CHANGELOG.md"
+    # Test loading existing changelog (file name unique to this test)
+    changelog_path = scratch / "EXISTING_CHANGELOG.md"
     changelog_path.write_text("""# Changelog
 
 All notable changes to this project will be documented in this file.
@@ -108,32 +148,7 @@ All notable changes to this project will be documented in this file.
 
 def test_categorize_changes(changelog_service):
     """Test change categorization."""
-    changes = [
-        Change(
-            description="add feature",
-            commit_hash="abc123",
-            commit_message="feat: add feature",
-            author="Test User",
-            type="feat",
-        ),
-        Change(
-            description="fix bug",
-            commit_hash="def456",
-            commit_message="fix: fix bug",
-            author="Test User",
-            type="fix",
-        ),
-        Change(
-            description="breaking change",
-            commit_hash="ghi789",
-            commit_message="feat!: breaking change",
-            author="Test User",
-            type="feat",
-            breaking=True,
-        ),
-    ]
-
-    categorized = changelog_service._categorize_changes(changes)
+    categorized = changelog_service._categorize_changes(list(_CANONICAL_CHANGES))
 
     assert "Added" in categorized
     assert "Fixed" in categorized
@@ -164,20 +179,20 @@ def test_generate_version(changelog_service):
     assert version.summary is None
 
 
-def test_save_changelog(tmp_path, config, git_service):
+def test_save_changelog(scratch, config, git_service):
     """Test saving changelog to file."""
-    output_path = tmp_path / "CHANGELOG.md"
+    output_path = scratch / "SAVED_CHANGELOG.md"
     config.output = output_path
 
     service = ChangelogService(config, git_service)
-    version = Version(
+    version = mk_version(
         number="1.0.0",
         date=datetime(2024, 1, 1),
         categories=[
-            Category(
+            mk_category(
                 name="Added",
                 changes=[
-                    Change(
+                    mk_change(
                         description="Initial release",
                         commit_hash="abc123",
                         commit_message="feat: initial release",
@@ -200,9 +215,9 @@ def test_save_changelog(tmp_path, config, git_service):
 
 def test_version_management(changelog_service):
     """Test version management methods."""
-    version1 = Version(number="1.0.0", date=datetime(2024, 1, 1))
-    version2 = Version(number="1.1.0", date=datetime(2024, 1, 2))
-    unreleased = Version(number="Unreleased", date=datetime(2024, 1, 3))
+    version1 = mk_version(number="1.0.0", date=datetime(2024, 1, 1))
+    version2 = mk_version(number="1.1.0", date=datetime(2024, 1, 2))
+    unreleased = mk_version(number="Unreleased", date=datetime(2024, 1, 3))
 
     changelog_service.add_version(version1)
     assert changelog_service.get_version("1.0.0") == version1
@@ -1,43 +1,59 @@
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import click
 import pytest
 from click.testing import CliRunner
 
+from autoscribe.cli.commands.generate import generate as generate_command
 from autoscribe.cli.main import cli
 from autoscribe.core.changelog import ChangelogService
-from autoscribe.core.git import GitService
-from autoscribe.models.changelog import Category, Change, Version
-from autoscribe.services.github import GitHubService
-from autoscribe.services.openai import AIService
+from autoscribe.models.config import AutoScribeConfig
+from tests.factories import mk_category, mk_change, mk_version
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner():
-    """Create a CLI runner."""
+    """Create a CLI runner (stateless, so shared across the module)."""
     return CliRunner()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_services():
-    """Create mock services."""
-    git_service = MagicMock(spec=GitService)
+    """Create mock services.
+
+    Only the changelog service needs MagicMock call tracking (the tests
+    assert on its calls and inject failures via side_effect); the git, AI
+    and GitHub services are plain namespaces of canned callables, with a
+    tracked MagicMock just for create_release. Module-scoped;
+    _reset_mock_services wipes call records and side effects between
+    tests while keeping the return values configured here.
+    """
+    git_service = SimpleNamespace(
+        get_latest_tag=lambda: "v1.0.0",
+        extract_repo_info=lambda: ("test-owner", "test-repo"),
+    )
     changelog_service = MagicMock(spec=ChangelogService)
-    github_service = MagicMock(spec=GitHubService)
-    ai_service = MagicMock(spec=AIService)
-
-    # Configure git service
-    git_service.get_latest_tag.return_value = "v1.0.0"
-    git_service.extract_repo_info.return_value = ("test-owner", "test-repo")
+    github_service = SimpleNamespace(
+        is_available=lambda: True,
+        create_release=MagicMock(
+            return_value=(
+                True,
+                "https://github.com/test-owner/test-repo/releases/v1.1.0",
+            )
+        ),
+    )
+    ai_service = SimpleNamespace(is_available=lambda: True)
 
     # Configure changelog service
-    version = Version(
+    version = mk_version(
         number="1.1.0",
         categories=[
-            Category(
+            mk_category(
                 name="Added",
                 changes=[
-                    Change(
+                    mk_change(
                         description="add feature",
                         commit_hash="abc123",
                         commit_message="feat: add feature",
@@ -58,6 +74,28 @@ def mock_services():
     }
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_services(mock_services):
+    """Reset the shared tracked mocks before each test."""
+    mock_services["changelog"].reset_mock(side_effect=True)
+    mock_services["github"].create_release.reset_mock()
+
+
+def _invoke_generate(**kwargs):
+    """Call the generate callback directly, skipping Click's parser.
+
+    For tests that only assert on mock interactions there is no need to
+    spin up a full CliRunner invocation per subcase; a bare Context with a
+    fresh config is enough. Tests that parse CLI output still go through
+    runner.invoke. Failures surface as SystemExit, like a real run.
+    """
+    params = {"version": None, "ai": None, "github_release": None, "no_cache": False}
+    params.update(kwargs)
+    ctx = click.Context(generate_command, obj={"config": AutoScribeConfig()})
+    with ctx:
+        generate_command.callback(**params)
+
+
 def test_version_command(runner):
     """Test version command."""
     result = runner.invoke(cli, ["--version"])
@@ -65,12 +103,14 @@ def test_version_command(runner):
     assert "autoscribe" in result.output
 
 
-@patch("autoscribe.cli.main.GitService")
-@patch("autoscribe.cli.main.ChangelogService")
-@patch("autoscribe.cli.main.GitHubService")
-@patch("autoscribe.cli.main.AIService")
+# The services are imported lazily inside setup_services, so the patches
+# target the defining modules rather than autoscribe.cli.main.
+@patch("autoscribe.core.git.GitService")
+@patch("autoscribe.core.changelog.ChangelogService")
+@patch("autoscribe.services.github.GitHubService")
+@patch("autoscribe.services.openai.AIService")
 def test_generate_command(
-    mock_ai_cls, mock_github_cls, mock_changelog_cls, mock_git_cls, runner, mock_services
+    mock_ai_cls, mock_github_cls, mock_changelog_cls, mock_git_cls, mock_services
 ):
     """Test generate command."""
     # Configure mocks
@@ -80,50 +120,45 @@ def test_generate_command(
     mock_ai_cls.return_value = mock_services["ai"]
 
     # Test basic generation
-    result = runner.invoke(cli, ["generate"])
-    assert result.exit_code == 0
+    _invoke_generate(version="1.1.0")
     mock_services["changelog"].generate_version.assert_called_once()
     mock_services["changelog"].add_version.assert_called_once()
 
-    # Test with version
-    result = runner.invoke(cli, ["generate", "--version", "2.0.0"])
-    assert result.exit_code == 0
+    # Test with another version
+    _invoke_generate(version="2.0.0")
     mock_services["changelog"].generate_version.assert_called_with("2.0.0")
 
     # Test with AI
-    result = runner.invoke(cli, ["generate", "--ai"])
-    assert result.exit_code == 0
+    _invoke_generate(version="2.1.0", ai=True)
     assert mock_ai_cls.called
 
     # Test with GitHub release
-    result = runner.invoke(cli, ["generate", "--github-release"])
-    assert result.exit_code == 0
+    _invoke_generate(version="2.2.0", github_release=True)
     assert mock_services["github"].create_release.called
 
+    # Test without a version number
+    with pytest.raises(SystemExit):
+        _invoke_generate()
 
-@patch("autoscribe.cli.main.GitService")
-@patch("autoscribe.cli.main.ChangelogService")
-def test_init_command(mock_changelog_cls, mock_git_cls, runner, mock_services, tmp_path):
-    """Test init command."""
-    mock_git_cls.return_value = mock_services["git"]
-    mock_changelog_cls.return_value = mock_services["changelog"]
 
-    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
-        # Test basic init
+def test_init_command(runner, scratch):
+    """Test init command."""
+    # isolated_filesystem makes its own unique subdirectory under scratch
+    with runner.isolated_filesystem(temp_dir=scratch) as td:
         result = runner.invoke(cli, ["init"])
         assert result.exit_code == 0
-        assert Path(td, "CHANGELOG.md").exists()
-        assert Path(td, ".autoscribe.toml").exists()
+        # One directory scan instead of a stat() per expected file
+        files = {entry.name for entry in Path(td).iterdir() if entry.is_file()}
+        assert {"CHANGELOG.md", "pyproject.toml"} <= files
 
-        # Test with custom output
-        result = runner.invoke(cli, ["init", "--output", "docs/CHANGELOG.md"])
+        # Re-running against the generated config is a no-op that succeeds
+        result = runner.invoke(cli, ["init"])
         assert result.exit_code == 0
-        assert Path(td, "docs/CHANGELOG.md").exists()
 
 
-def test_config_validation(runner, tmp_path):
+def test_config_validation(runner, scratch):
     """Test configuration validation."""
-    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+    with runner.isolated_filesystem(temp_dir=scratch) as td:
         # Test invalid config
         config_path = Path(td, ".autoscribe.toml")
         config_path.write_text("""
@@ -131,29 +166,30 @@ def test_config_validation(runner, tmp_path):
             invalid = true
         """)
 
-        result = runner.invoke(cli, ["generate"])
+        result = runner.invoke(cli, ["generate", "--version", "1.0.0"])
         assert result.exit_code != 0
         assert "Generation failed" in result.output
 
 
-@patch("autoscribe.cli.main.GitService")
-@patch("autoscribe.cli.main.ChangelogService")
+@patch("autoscribe.core.git.GitService")
+@patch("autoscribe.core.changelog.ChangelogService")
 def test_error_handling(mock_changelog_cls, mock_git_cls, runner, mock_services):
     """Test error handling."""
-    mock_git_cls.return_value = mock_services["git"]
     mock_changelog_cls.return_value = mock_services["changelog"]
 
     # Test git error
-    mock_services["git"].get_latest_tag.side_effect = RuntimeError("Git error")
-    result = runner.invoke(cli, ["generate"])
+    mock_git_cls.side_effect = RuntimeError("Git error")
+    result = runner.invoke(cli, ["generate", "--version", "1.0.0", "--no-github-release"])
     assert result.exit_code != 0
-    assert "Error" in result.output
+    assert "Generation failed" in result.output
 
     # Test changelog error
+    mock_git_cls.side_effect = None
+    mock_git_cls.return_value = mock_services["git"]
     mock_services["changelog"].generate_version.side_effect = RuntimeError("Changelog error")
-    result = runner.invoke(cli, ["generate"])
+    result = runner.invoke(cli, ["generate", "--version", "1.0.0", "--no-github-release"])
     assert result.exit_code != 0
-    assert "Error" in result.output
+    assert "Generation failed" in result.output
 
 
 def test_help_command(runner):
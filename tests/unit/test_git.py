@@ -1,20 +1,43 @@
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from autoscribe.core.git import GitCommandError, GitCommit, GitService
 
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _run_result(stdout="", stderr="", returncode=0):
+    """Completed-process stand-in for mocked subprocess.run calls.
+
+    The code under test only reads these three attributes, so a plain
+    SimpleNamespace is enough — no MagicMock machinery needed.
+    """
+    return SimpleNamespace(stdout=stdout, stderr=stderr, returncode=returncode)
+
 
 @pytest.fixture
 def git_service():
-    """Create a GitService instance for testing."""
-    return GitService()
+    """Create a GitService instance without touching a real repository.
+
+    The constructor's rev-parse validation is served from a canned
+    answer, so logic-only tests (parsing, Change conversion) spawn no
+    git subprocess and don't depend on the test runner's cwd being a
+    repo. The patch is undone before the test body runs, so tests that
+    exercise _run_command against a mocked subprocess still can.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            GitService, "_run_command", lambda self, argv: ".git\n/fake/repo"
+        )
+        return GitService()
 
 
 def test_git_commit():
     """Test GitCommit dataclass."""
-    now = datetime.now()
+    now = _NOW
     commit = GitCommit(
         hash="abc123",
         message="feat: add feature",
@@ -28,72 +51,48 @@ def test_git_commit():
     assert commit.date == now
 
 
-def test_parse_conventional_commit(git_service):
+PARSE_CASES = [
+    ("feat(api): add new endpoint", ("feat", "api", "add new endpoint", False)),
+    ("feat!: breaking feature", ("feat", None, "breaking feature", True)),
+    (
+        "feat: feature\n\nBREAKING CHANGE: breaks stuff",
+        ("feat", None, "feature", True),
+    ),
+    ("random commit message", ("other", None, "random commit message", False)),
+]
+
+
+@pytest.mark.parametrize(("message", "expected"), PARSE_CASES)
+def test_parse_conventional_commit(git_service, message, expected):
     """Test parsing of conventional commit messages."""
-    # Test feature commit
-    type_, scope, desc, breaking = git_service.parse_conventional_commit(
-        "feat(api): add new endpoint"
-    )
-    assert type_ == "feat"
-    assert scope == "api"
-    assert desc == "add new endpoint"
-    assert not breaking
-
-    # Test breaking change with !
-    type_, scope, desc, breaking = git_service.parse_conventional_commit(
-        "feat!: breaking feature"
-    )
-    assert type_ == "feat"
-    assert scope is None
-    assert desc == "breaking feature"
-    assert breaking
-
-    # Test breaking change in body
-    type_, scope, desc, breaking = git_service.parse_conventional_commit(
-        "feat: feature\n\nBREAKING CHANGE: breaks stuff"
-    )
-    assert type_ == "feat"
-    assert scope is None
-    assert desc == "feature"
-    assert breaking
-
-    # Test non-conventional commit
-    type_, scope, desc, breaking = git_service.parse_conventional_commit(
-        "random commit message"
-    )
-    assert type_ == "other"
-    assert scope is None
-    assert desc == "random commit message"
-    assert not breaking
+    assert git_service.parse_conventional_commit(message) == expected
 
 
 @patch("subprocess.run")
 def test_run_command(mock_run, git_service):
     """Test running git commands."""
-    mock_run.return_value = MagicMock(
-        stdout="test output\n",
-        stderr="",
-        returncode=0,
-    )
+    mock_run.return_value = _run_result(stdout="test output\n")
 
-    output = git_service._run_command("git status")
+    output = git_service._run_command(["git", "status"])
     assert output == "test output"
     mock_run.assert_called_once()
 
     # Test command failure
     mock_run.side_effect = Exception("Command failed")
     with pytest.raises(GitCommandError):
-        git_service._run_command("git status")
+        git_service._run_command(["git", "status"])
 
 
-@patch("subprocess.run")
-def test_get_commits_since_tag(mock_run, git_service):
+@patch("subprocess.Popen")
+def test_get_commits_since_tag(mock_popen, git_service):
     """Test getting commits since tag."""
-    mock_run.return_value = MagicMock(
-        stdout="abc123|feat: add feature|Test User|2024-01-01T12:00:00+00:00\n"
-              "def456|fix: fix bug|Test User|2024-01-02T12:00:00+00:00",
-        stderr="",
-        returncode=0,
+    mock_popen.return_value = MagicMock(
+        stdout=[
+            "abc123\x1ffeat: add feature\x1fTest User\x1f2024-01-01T12:00:00+00:00\x1e\n",
+            "def456\x1ffix: fix bug\x1fTest User\x1f2024-01-02T12:00:00+00:00\x1e\n",
+        ],
+        stderr=MagicMock(read=MagicMock(return_value="")),
+        wait=MagicMock(return_value=0),
     )
 
     # Test with tag
@@ -112,16 +111,13 @@ def test_get_commits_since_tag(mock_run, git_service):
 @patch("subprocess.run")
 def test_get_latest_tag(mock_run, git_service):
     """Test getting latest tag."""
-    mock_run.return_value = MagicMock(
-        stdout="v1.0.0\n",
-        stderr="",
-        returncode=0,
-    )
+    mock_run.return_value = _run_result(stdout="v1.0.0\n")
 
     tag = git_service.get_latest_tag()
     assert tag == "v1.0.0"
 
-    # Test no tags
+    # Test no tags (clear the per-instance memo so the query re-runs)
+    git_service._query_cache.clear()
     mock_run.side_effect = Exception("No tags")
     assert git_service.get_latest_tag() is None
 
@@ -132,7 +128,7 @@ def test_create_change_from_commit(git_service):
         hash="abc123",
         message="feat(api): add feature",
         author="Test User",
-        date=datetime.now(),
+        date=_NOW,
     )
 
     change = git_service.create_change_from_commit(commit)
@@ -147,17 +143,12 @@ def test_create_change_from_commit(git_service):
 @patch("subprocess.run")
 def test_tag_operations(mock_run, git_service):
     """Test tag creation and pushing."""
-    mock_run.return_value = MagicMock(
-        stdout="",
-        stderr="",
-        returncode=0,
-    )
+    mock_run.return_value = _run_result()
 
     # Test creating tag
     git_service.create_tag("v1.0.0", "Release v1.0.0")
     mock_run.assert_called_with(
-        'git tag -a v1.0.0 -m "Release v1.0.0"',
-        shell=True,
+        ["git", "tag", "-a", "v1.0.0", "-m", "Release v1.0.0"],
         cwd=git_service.cwd,
         capture_output=True,
         text=True,
@@ -167,8 +158,7 @@ def test_tag_operations(mock_run, git_service):
     # Test pushing tag
     git_service.push_tag("v1.0.0")
     mock_run.assert_called_with(
-        "git push origin v1.0.0",
-        shell=True,
+        ["git", "push", "origin", "v1.0.0"],
         cwd=git_service.cwd,
         capture_output=True,
         text=True,
@@ -176,38 +166,30 @@ def test_tag_operations(mock_run, git_service):
     )
 
 
-@patch("subprocess.run")
-def test_remote_operations(mock_run, git_service):
-    """Test remote URL operations."""
-    # Test HTTPS URL
-    mock_run.return_value = MagicMock(
-        stdout="https://github.com/user/repo.git\n",
-        stderr="",
-        returncode=0,
-    )
-
-    url = git_service.get_remote_url()
-    assert url == "https://github.com/user/repo.git"
+REMOTE_URL_CASES = [
+    ("https://github.com/user/repo.git", "user", "repo"),
+    ("git@github.com:user/repo.git", "user", "repo"),
+    ("invalid-url", None, None),
+]
 
-    owner, repo = git_service.extract_repo_info()
-    assert owner == "user"
-    assert repo == "repo"
 
-    # Test SSH URL
-    mock_run.return_value.stdout = "git@github.com:user/repo.git\n"
-    owner, repo = git_service.extract_repo_info()
-    assert owner == "user"
-    assert repo == "repo"
+@pytest.mark.parametrize(("url", "owner", "repo"), REMOTE_URL_CASES)
+@patch("subprocess.run")
+def test_remote_operations(mock_run, url, owner, repo):
+    """Test remote URL operations."""
+    # Remote lookups are memoized per instance, so each case gets a fresh
+    # service.
+    mock_run.return_value = _run_result(stdout=f"{url}\n")
+    service = GitService()
+    assert service.get_remote_url() == url
+    assert service.extract_repo_info() == (owner, repo)
 
-    # Test invalid URL
-    mock_run.return_value.stdout = "invalid-url\n"
-    owner, repo = git_service.extract_repo_info()
-    assert owner is None
-    assert repo is None
 
-    # Test no remote
+@patch("subprocess.run")
+def test_remote_operations_no_remote(mock_run):
+    """A missing remote yields no URL and no repo info."""
+    mock_run.return_value = _run_result()
+    service = GitService()
     mock_run.side_effect = RuntimeError("No remote")
-    assert git_service.get_remote_url() is None
-    owner, repo = git_service.extract_repo_info()
-    assert owner is None
-    assert repo is None
+    assert service.get_remote_url() is None
+    assert service.extract_repo_info() == (None, None)
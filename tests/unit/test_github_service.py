@@ -1,16 +1,31 @@
-from unittest.mock import patch
-
 import pytest
 
+from autoscribe.models.config import AutoScribeConfig
 from autoscribe.services.github import GitHubService
 
 
-@pytest.fixture
-def github_service(sample_config, mock_github):
-    """Create a GitHub service instance with mocked client."""
-    with patch("github.Github", mock_github):
-        service = GitHubService(sample_config)
-        return service
+@pytest.fixture(autouse=True, scope="module")
+def _patch_github(mock_github):
+    """Patch the service's Github binding once for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("autoscribe.services.github.Github", mock_github)
+        yield
+
+
+@pytest.fixture(scope="module")
+def github_service():
+    """Create a GitHub service instance with mocked client.
+
+    Module-scoped: the read-only tests share one instance, and the tests
+    that mutate config build their own throwaway service instead.
+    """
+    return GitHubService(AutoScribeConfig(github_token="test-token", github_release=True))
+
+
+def test_initialization(github_service):
+    """Test GitHubService initialization."""
+    assert github_service.config.github_token == "test-token"
+    assert github_service._github is not None
 
 
 def test_is_available(github_service):
@@ -18,6 +33,13 @@ def test_is_available(github_service):
     assert github_service.is_available()
 
 
+def test_is_available_without_token(sample_config):
+    """A service built without a token is never available."""
+    sample_config.github_token = None
+    service = GitHubService(sample_config)
+    assert not service.is_available()
+
+
 def test_create_release(github_service):
     """Test creating GitHub release."""
     success, url = github_service.create_release(
@@ -34,6 +56,29 @@ def test_create_release(github_service):
     assert url == "https://github.com/test/repo/releases/v1.0.0"
 
 
+def test_create_releases_bulk(github_service):
+    """Bulk creation returns one result per spec, in spec order."""
+    specs = [
+        {
+            "owner": "test",
+            "repo": "test",
+            "tag_name": f"v1.0.{i}",
+            "name": f"v1.0.{i}",
+            "body": "Test release",
+        }
+        for i in range(3)
+    ]
+
+    results = github_service.create_releases_bulk(specs)
+    assert results == [(True, "https://github.com/test/repo/releases/v1.0.0")] * 3
+
+
+def test_create_releases_bulk_empty():
+    """No specs short-circuits before any client or pool is touched."""
+    service = GitHubService(AutoScribeConfig(github_release=True))
+    assert service.create_releases_bulk([]) == []
+
+
 def test_update_release(github_service):
     """Test updating a release."""
     success, url = github_service.update_release(
@@ -81,16 +126,20 @@ def test_delete_release(github_service):
     assert error is None
 
 
-def test_error_handling(github_service):
-    """Test error handling."""
-    # Test with invalid token
-    github_service.config.github_token = "invalid-token"
-    assert not github_service.is_available()
-
-    # Test with disabled GitHub release
-    github_service.config.github_release = False
-    assert not github_service.is_available()
-
-    # Test with no token
-    github_service.config.github_token = None
-    assert not github_service.is_available()
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        ("github_token", "invalid-token"),
+        ("github_release", False),
+        ("github_token", None),
+    ],
+)
+def test_error_handling(sample_config, field, value):
+    """Each misconfiguration independently makes the service unavailable."""
+    # Own service per case: the config is rewritten mid-test, which also
+    # exercises the token-change client refresh.
+    service = GitHubService(sample_config)
+    assert service.is_available()
+
+    setattr(service.config, field, value)
+    assert not service.is_available()
@@ -1,18 +1,63 @@
+import json
 from datetime import datetime
-from unittest.mock import patch
+from types import SimpleNamespace
 
 import pytest
 
-from autoscribe.models.changelog import Category, Change, Version
 from autoscribe.services.openai import AIService
+from tests.factories import mk_category, mk_change, mk_version
+
+# Canonical feat/fix input changes, built once; the service never mutates
+# its input (enhancement returns new Change objects).
+_SAMPLE_CHANGES = (
+    mk_change(
+        description="add feature",
+        commit_hash="abc123",
+        commit_message="feat: add feature",
+        author="Test User",
+        type="feat",
+    ),
+    mk_change(
+        description="fix bug",
+        commit_hash="def456",
+        commit_message="fix: fix bug",
+        author="Test User",
+        type="fix",
+    ),
+)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _patch_openai(mock_openai, mock_async_openai):
+    """Patch the service's OpenAI bindings once for the whole module.
+
+    The clients are constructed lazily, so the patch has to outlive
+    service construction; one module-scoped monkeypatch replaces a
+    per-test unittest.mock.patch context manager in every test body.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("autoscribe.services.openai.OpenAI", mock_openai)
+        mp.setattr("autoscribe.services.openai.AsyncOpenAI", mock_async_openai)
+        yield
 
 
 @pytest.fixture
-def ai_service(sample_config, mock_openai):
+def ai_service(sample_config):
     """Create an AI service instance with mocked client."""
-    with patch("openai.OpenAI", mock_openai):
-        service = AIService(sample_config)
-        return service
+    return AIService(sample_config)
+
+
+@pytest.fixture(scope="module")
+def sample_version():
+    """Nested two-category version, built once for the summary test."""
+    return mk_version(
+        number="1.0.0",
+        date=datetime(2024, 1, 1),
+        categories=[
+            mk_category(name="Added", changes=[_SAMPLE_CHANGES[0]]),
+            mk_category(name="Fixed", changes=[_SAMPLE_CHANGES[1]]),
+        ],
+    )
 
 
 def test_is_available(ai_service):
@@ -22,76 +67,127 @@ def test_is_available(ai_service):
 
 def test_enhance_changes(ai_service):
     """Test enhancing changes with AI."""
-    changes = [
-        Change(
-            description="add feature",
-            commit_hash="abc123",
-            commit_message="feat: add feature",
-            author="Test User",
-            type="feat",
-        ),
-        Change(
-            description="fix bug",
-            commit_hash="def456",
-            commit_message="fix: fix bug",
-            author="Test User",
-            type="fix",
-        ),
-    ]
-
-    enhanced = ai_service.enhance_changes(changes)
+    enhanced = ai_service.enhance_changes(list(_SAMPLE_CHANGES))
     assert len(enhanced) == 2
     assert all(change.ai_enhanced for change in enhanced)
     assert all(change.description == "Enhanced description" for change in enhanced)
 
 
-def test_generate_version_summary(ai_service):
+def test_generate_version_summary(ai_service, sample_version):
     """Test generating version summary with AI."""
-    version = Version(
-        number="1.0.0",
-        date=datetime.now(),
-        categories=[
-            Category(
-                name="Added",
-                changes=[
-                    Change(
-                        description="add feature",
-                        commit_hash="abc123",
-                        commit_message="feat: add feature",
-                        author="Test User",
-                        type="feat",
-                    ),
-                ],
-            ),
-            Category(
-                name="Fixed",
-                changes=[
-                    Change(
-                        description="fix bug",
-                        commit_hash="def456",
-                        commit_message="fix: fix bug",
-                        author="Test User",
-                        type="fix",
-                    ),
-                ],
-            ),
-        ],
-    )
-
-    summarized = ai_service.generate_version_summary(version)
+    summarized = ai_service.generate_version_summary(sample_version)
     assert summarized.summary == "Enhanced description"
 
 
-def test_error_handling(ai_service):
-    """Test error handling."""
-    # Test with invalid API key
-    ai_service.config.openai_api_key = "invalid-key"
-    assert not ai_service.is_available()
+def test_enhance_changes_uses_cache(ai_service):
+    """Test that repeated enhancement is served from the response cache."""
+    changes = [_SAMPLE_CHANGES[0]]
+
+    first = ai_service.enhance_changes(changes)
+    again = ai_service.enhance_changes(changes)
+    assert [change.description for change in first] == ["Enhanced description"]
+    assert [change.description for change in again] == ["Enhanced description"]
+    assert all(change.ai_enhanced for change in again)
 
-    # Test with disabled AI
-    ai_service.config.ai_enabled = False
-    assert not ai_service.is_available()
 
-    # Test with no API key
-    ai_service.config.openai_api_key = None
+@pytest.mark.asyncio
+async def test_aenhance_changes(ai_service):
+    """Test enhancing changes concurrently with the async client."""
+    enhanced = await ai_service.aenhance_changes(list(_SAMPLE_CHANGES))
+    assert len(enhanced) == 2
+    assert all(change.ai_enhanced for change in enhanced)
+    assert all(change.description == "Enhanced description" for change in enhanced)
+
+
+def test_enhance_one_streams_completion(ai_service):
+    """Test the per-change fallback path, which streams its completion."""
+    assert ai_service.is_available()
+    enhanced = ai_service._enhance_one(_SAMPLE_CHANGES[0])
+    assert enhanced.ai_enhanced
+    assert enhanced.description == "Enhanced description"
+
+
+class _BatchStubClient:
+    """Sync client exposing just the Batch API surface the service touches."""
+
+    def __init__(self, status="completed", output_lines=()):
+        batch = SimpleNamespace(id="batch-1", status=status, output_file_id="file-out")
+        self.models = SimpleNamespace(list=lambda: [{"id": "gpt-4"}])
+        self.files = SimpleNamespace(
+            create=lambda file, purpose: SimpleNamespace(id="file-in"),
+            content=lambda file_id: SimpleNamespace(text="\n".join(output_lines)),
+        )
+        self.batches = SimpleNamespace(
+            create=lambda **kwargs: batch,
+            retrieve=lambda batch_id: batch,
+        )
+
+
+def _batch_output_line(custom_id, content):
+    """One output-JSONL record as the Batch API returns it."""
+    return json.dumps({
+        "custom_id": custom_id,
+        "response": {
+            "status_code": 200,
+            "body": {"choices": [{"message": {"content": content}}]},
+        },
+    })
+
+
+def test_enhance_changes_batch_completed(ai_service):
+    """A completed batch maps output records back onto input order."""
+    ai_service._client = _BatchStubClient(output_lines=[
+        _batch_output_line("def456", "Batch-enhanced fix"),
+        _batch_output_line("abc123", "Batch-enhanced feature"),
+    ])
+
+    enhanced = ai_service.enhance_changes_batch(list(_SAMPLE_CHANGES))
+    assert [change.description for change in enhanced] == [
+        "Batch-enhanced feature",
+        "Batch-enhanced fix",
+    ]
+    assert all(change.ai_enhanced for change in enhanced)
+
+
+def test_enhance_changes_batch_failed(ai_service):
+    """A failed batch returns the original changes unmodified."""
+    ai_service._client = _BatchStubClient(status="failed")
+
+    enhanced = ai_service.enhance_changes_batch(list(_SAMPLE_CHANGES))
+    assert enhanced == list(_SAMPLE_CHANGES)
+    assert not any(change.ai_enhanced for change in enhanced)
+
+
+def test_enhance_changes_batch_timeout(ai_service):
+    """An expired deadline abandons the poll loop without enhancing."""
+    ai_service._client = _BatchStubClient(status="in_progress")
+
+    enhanced = ai_service.enhance_changes_batch(
+        list(_SAMPLE_CHANGES), poll_interval=0, timeout=-1
+    )
+    assert enhanced == list(_SAMPLE_CHANGES)
+
+
+def test_batch_mode_routes_enhance_changes(ai_service):
+    """With batch_mode set, enhance_changes dispatches to the Batch API."""
+    ai_service.config.batch_mode = True
+    ai_service._client = _BatchStubClient(output_lines=[
+        _batch_output_line("abc123", "Batch-enhanced feature"),
+    ])
+
+    enhanced = ai_service.enhance_changes([_SAMPLE_CHANGES[0]])
+    assert enhanced[0].description == "Batch-enhanced feature"
+
+
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        ("openai_api_key", "invalid-key"),
+        ("ai_enabled", False),
+        ("openai_api_key", None),
+    ],
+)
+def test_error_handling(ai_service, field, value):
+    """Each misconfiguration independently makes the service unavailable."""
+    setattr(ai_service.config, field, value)
     assert not ai_service.is_available()
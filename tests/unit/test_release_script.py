@@ -0,0 +1,203 @@
+"""Tests for the release-automation script in autoscribe.main."""
+
+import sys
+
+import pytest
+
+import autoscribe.main as release
+
+SAMPLE_CHANGELOG = """# Changelog
+
+## [1.0.0] - 2024-01-01
+
+### ✨ Features
+- add new feature
+
+## [0.9.0] - 2023-12-01
+
+### 🐛 Bug Fixes
+- resolve critical bug
+"""
+
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    """Replace run_command with a prefix-matched dispatch table.
+
+    Returns a ``respond(prefix, output=...)`` function for tests to record
+    outputs; unexpected commands fail the test instead of spawning a
+    subprocess.
+    """
+    outputs: dict[str, str] = {}
+
+    def respond(prefix: str, output: str = "") -> None:
+        outputs[prefix] = output
+
+    def run(cmd: str) -> str:
+        for prefix, output in outputs.items():
+            if cmd.startswith(prefix):
+                return output
+        raise AssertionError(f"Unexpected command: {cmd}")
+
+    monkeypatch.setattr(release, "run_command", run)
+    return respond
+
+
+def test_parse_commit_message():
+    assert release.parse_commit_message("feat: add feature") == ("feat", "add feature")
+    assert release.parse_commit_message("fix(core): resolve bug") == ("fix", "resolve bug")
+    assert release.parse_commit_message("not conventional") == ("other", "not conventional")
+
+
+def test_categorize_commits():
+    categorized = release.categorize_commits(
+        [
+            "feat: add feature",
+            "feat: another feature",
+            "fix: resolve bug",
+            "random noise",
+        ]
+    )
+    assert categorized["feat"] == ["add feature", "another feature"]
+    assert categorized["fix"] == ["resolve bug"]
+    assert categorized["other"] == ["random noise"]
+    # Empty categories are dropped
+    assert "docs" not in categorized
+
+
+def test_get_changelog_entry(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "CHANGELOG.md").write_text(SAMPLE_CHANGELOG)
+
+    entry = release.get_changelog_entry("1.0.0")
+    assert "add new feature" in entry
+    assert "resolve critical bug" not in entry
+
+    assert release.get_changelog_entry("3.0.0") == ""
+
+
+def test_update_changelog(tmp_path, monkeypatch, fake_run):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "CHANGELOG.md").write_text("# Changelog\n\n")
+    fake_run("git describe", output="v1.0.0")
+    fake_run("git log", output="feat: add feature\nfix: resolve bug\nrandom noise")
+
+    release.update_changelog("1.1.0")
+
+    content = (tmp_path / "CHANGELOG.md").read_text()
+    assert "## [1.1.0]" in content
+    assert "### ✨ Features" in content
+    assert "- add feature" in content
+    assert "### 🔄 Other Changes" in content
+    assert "- random noise" in content
+
+
+def test_update_changelog_without_tags(tmp_path, monkeypatch, fake_run):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "CHANGELOG.md").write_text("# Changelog\n\n")
+    fake_run("git describe", output="")
+    fake_run("git log", output="fix: resolve bug")
+
+    release.update_changelog("0.1.0")
+
+    content = (tmp_path / "CHANGELOG.md").read_text()
+    assert "## [0.1.0]" in content
+    assert "- resolve bug" in content
+
+
+def test_create_github_release_dry_run(fake_run, capsys):
+    release.create_github_release("1.0.0", dry_run=True)
+    assert "Would create tag: v1.0.0" in capsys.readouterr().out
+
+
+def test_create_github_release_without_token(fake_run, monkeypatch, capsys):
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    fake_run("git tag")
+    fake_run("git push")
+
+    release.create_github_release("1.0.0")
+
+    out = capsys.readouterr().out
+    assert "Created and pushed tag v1.0.0" in out
+    assert "Skipping GitHub Release creation" in out
+
+
+def test_create_github_release_with_token(tmp_path, monkeypatch, fake_run, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "CHANGELOG.md").write_text(SAMPLE_CHANGELOG)
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    fake_run("git tag")
+    fake_run("git push")
+    fake_run("git remote get-url", output="git@github.com:test-owner/test-repo.git")
+
+    requests = []
+
+    class FakeResponse:
+        status = 201
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+    def fake_urlopen(request):
+        requests.append(request)
+        return FakeResponse()
+
+    monkeypatch.setattr(release.urllib.request, "urlopen", fake_urlopen)
+
+    release.create_github_release("1.0.0")
+
+    assert "Created GitHub Release" in capsys.readouterr().out
+    assert len(requests) == 1
+    assert requests[0].full_url == "https://api.github.com/repos/test-owner/test-repo/releases"
+
+
+def test_create_version_commits(tmp_path, monkeypatch, fake_run, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "CHANGELOG.md").write_text("# Changelog\n\n")
+    fake_run("git describe", output="")
+    fake_run("git log", output="feat: add feature")
+    fake_run("git add")
+    fake_run("git commit")
+
+    release.create_version_commits("1.1.0")
+
+    out = capsys.readouterr().out
+    assert "Committed version bump" in out
+    assert "Committed changelog update" in out
+    assert "## [1.1.0]" in (tmp_path / "CHANGELOG.md").read_text()
+
+
+def test_main_dry_run(monkeypatch, fake_run, capsys):
+    monkeypatch.setattr(sys, "argv", ["autoscribe", "minor", "--dry-run"])
+    fake_run("git branch --show-current", output="main")
+    fake_run("git status --porcelain", output="")
+    fake_run("poetry version -s", output="1.0.0")
+    fake_run("poetry version minor", output="autoscribe 1.1.0")
+
+    release.main()
+
+    out = capsys.readouterr().out
+    assert "Bumping version: 1.0.0 -> 1.1.0" in out
+    assert "Dry run completed" in out
+
+
+def test_main_requires_main_branch(monkeypatch, fake_run, capsys):
+    monkeypatch.setattr(sys, "argv", ["autoscribe", "patch"])
+    fake_run("git branch --show-current", output="feature-branch")
+
+    with pytest.raises(SystemExit):
+        release.main()
+    assert "Must be on main branch" in capsys.readouterr().out
+
+
+def test_main_requires_clean_tree(monkeypatch, fake_run, capsys):
+    monkeypatch.setattr(sys, "argv", ["autoscribe", "patch"])
+    fake_run("git branch --show-current", output="main")
+    fake_run("git status --porcelain", output="M pyproject.toml")
+
+    with pytest.raises(SystemExit):
+        release.main()
+    assert "Working directory is not clean" in capsys.readouterr().out
@@ -1,59 +1,37 @@
 import pytest
 
-from autoscribe.utils.version import Version, VersionType, extract_version, suggest_version_bump
+from autoscribe.utils.version import (
+    Version,
+    VersionType,
+    extract_version,
+    suggest_version_bump,
+    update_version_in_file,
+)
+
+PARSE_CASES = [
+    ("1.2.3", None, None),
+    ("1.2.3-alpha.1", "alpha.1", None),
+    ("1.2.3+build.123", None, "build.123"),
+    ("1.2.3-beta.2+build.123", "beta.2", "build.123"),
+]
+
+
+@pytest.mark.parametrize(("version", "prerelease", "build"), PARSE_CASES)
+def test_version_parsing(version, prerelease, build):
+    """Test version string parsing."""
+    v = Version.parse(version)
+    assert (v.major, v.minor, v.patch) == (1, 2, 3)
+    assert v.prerelease == prerelease
+    assert v.build == build
 
 
-def test_version_parsing():
-    """Test version string parsing."""
-    # Test basic version
-    v = Version.parse("1.2.3")
-    assert v.major == 1
-    assert v.minor == 2
-    assert v.patch == 3
-    assert v.prerelease is None
-    assert v.build is None
-
-    # Test version with prerelease
-    v = Version.parse("1.2.3-alpha.1")
-    assert v.major == 1
-    assert v.minor == 2
-    assert v.patch == 3
-    assert v.prerelease == "alpha.1"
-    assert v.build is None
-
-    # Test version with build metadata
-    v = Version.parse("1.2.3+build.123")
-    assert v.major == 1
-    assert v.minor == 2
-    assert v.patch == 3
-    assert v.prerelease is None
-    assert v.build == "build.123"
-
-    # Test full version
-    v = Version.parse("1.2.3-beta.2+build.123")
-    assert v.major == 1
-    assert v.minor == 2
-    assert v.patch == 3
-    assert v.prerelease == "beta.2"
-    assert v.build == "build.123"
-
-
-def test_invalid_version_parsing():
+@pytest.mark.parametrize(
+    "version", ["", "1", "1.2", "1.2.3.4", "v1.2.3", "1.2.3-", "1.2.3+", "1.2.a"]
+)
+def test_invalid_version_parsing(version):
     """Test parsing invalid version strings."""
-    invalid_versions = [
-        "",
-        "1",
-        "1.2",
-        "1.2.3.4",
-        "v1.2.3",
-        "1.2.3-",
-        "1.2.3+",
-        "1.2.a",
-    ]
-
-    for version in invalid_versions:
-        with pytest.raises(ValueError):
-            Version.parse(version)
+    with pytest.raises(ValueError):
+        Version.parse(version)
 
 
 def test_version_bumping():
@@ -73,33 +51,28 @@ def test_version_bumping():
     assert str(v_patch) == "1.2.4"
 
 
-def test_version_comparison():
-    """Test version comparison."""
-    v1 = Version.parse("1.2.3")
-    v2 = Version.parse("2.0.0")
-    v3 = Version.parse("1.3.0")
-    v4 = Version.parse("1.2.4")
+COMPARISON_CASES = [
+    ("1.2.3", "2.0.0", True),
+    ("1.2.3", "1.3.0", True),
+    ("1.2.3", "1.2.4", True),
+    ("2.0.0", "1.2.3", False),
+    ("1.3.0", "1.2.3", False),
+    ("1.2.4", "1.2.3", False),
+]
 
-    assert v1 < v2
-    assert v1 < v3
-    assert v1 < v4
-    assert not v2 < v1
-    assert not v3 < v1
-    assert not v4 < v1
 
+@pytest.mark.parametrize(("left", "right", "expected_lt"), COMPARISON_CASES)
+def test_version_comparison(left, right, expected_lt):
+    """Test version comparison."""
+    assert (Version.parse(left) < Version.parse(right)) is expected_lt
 
-def test_version_string_representation():
-    """Test version string representation."""
-    versions = [
-        ("1.2.3", "1.2.3"),
-        ("1.2.3-alpha.1", "1.2.3-alpha.1"),
-        ("1.2.3+build.123", "1.2.3+build.123"),
-        ("1.2.3-beta.2+build.123", "1.2.3-beta.2+build.123"),
-    ]
 
-    for input_version, expected_output in versions:
-        v = Version.parse(input_version)
-        assert str(v) == expected_output
+@pytest.mark.parametrize(
+    "version", ["1.2.3", "1.2.3-alpha.1", "1.2.3+build.123", "1.2.3-beta.2+build.123"]
+)
+def test_version_string_representation(version):
+    """Parsing and re-stringifying a version round-trips exactly."""
+    assert str(Version.parse(version)) == version
 
 
 def test_extract_version():
@@ -121,6 +94,50 @@ def test_extract_version():
     assert version is None
 
 
+def test_prerelease_comparison():
+    """Test prerelease precedence following SemVer rules."""
+    assert Version.parse("1.0.0-alpha") < Version.parse("1.0.0-beta")
+    assert Version.parse("1.0.0-alpha") < Version.parse("1.0.0")
+    assert not Version.parse("1.0.0") < Version.parse("1.0.0-alpha")
+    assert not Version.parse("1.0.0-alpha") < Version.parse("1.0.0-alpha")
+
+
+def test_update_version_in_file(tmp_path):
+    """Test updating the version in a file."""
+    version_file = tmp_path / "pyproject.toml"
+    version_file.write_text('name = "test"\nversion = \'1.2.3\'\n')
+
+    success, message = update_version_in_file(
+        str(version_file), "1.3.0", "version = '{version}'"
+    )
+    assert success is True
+    assert "1.3.0" in message
+    assert "version = '1.3.0'" in version_file.read_text()
+
+
+def test_update_version_in_file_pattern_not_found(tmp_path):
+    """Test updating a file that does not contain the version pattern."""
+    version_file = tmp_path / "pyproject.toml"
+    version_file.write_text('name = "test"\n')
+
+    success, message = update_version_in_file(
+        str(version_file), "1.3.0", "version = '{version}'"
+    )
+    assert success is False
+    assert "not found" in message
+    # No leftover tempfile from the aborted write
+    assert list(tmp_path.iterdir()) == [version_file]
+
+
+def test_update_version_in_file_missing_file(tmp_path):
+    """Test updating a file that does not exist."""
+    success, message = update_version_in_file(
+        str(tmp_path / "missing.toml"), "1.3.0", "version = '{version}'"
+    )
+    assert success is False
+    assert "Failed to update version" in message
+
+
 def test_suggest_version_bump():
     """Test version bump suggestions."""
     # Test breaking changes